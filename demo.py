@@ -19,7 +19,7 @@ stream = client.chat.completions.create(
 
 for chunk in stream:
     anthropic_event = converter.convert_stream_event(
-        chunk.model_dump(), Provider.openai, Provider.anthropic
+        chunk.model_dump_json(), Provider.openai, Provider.anthropic
     )
     print(f"[Anthropic] {anthropic_event}", flush=True)
 
@@ -4,16 +4,30 @@ A brand-neutral intermediate representation (IR) for converting between
 any two LLM API formats.
 """
 
-from .adapters.openai import OpenAIAdapter
-from .adapters.anthropic import AnthropicAdapter
-from .adapters.gemini import GeminiAdapter
 from .utils.provider_registry import ProviderRegistry
 from .core.schema import Provider
 
-# Register built-in adapters
-ProviderRegistry.register(Provider.openai, OpenAIAdapter)
-ProviderRegistry.register(Provider.anthropic, AnthropicAdapter)
-ProviderRegistry.register(Provider.gemini, GeminiAdapter)
+# Register built-in adapters by import path; each adapter module is only
+# imported the first time its provider is used
+_BUILTIN_ADAPTERS = {
+    "OpenAIAdapter": (Provider.openai, f"{__name__}.adapters.openai"),
+    "AnthropicAdapter": (Provider.anthropic, f"{__name__}.adapters.anthropic"),
+    "GeminiAdapter": (Provider.gemini, f"{__name__}.adapters.gemini"),
+}
+
+for _name, (_provider, _module) in _BUILTIN_ADAPTERS.items():
+    ProviderRegistry.register_lazy(_provider, f"{_module}:{_name}")
+
+
+def __getattr__(name: str):
+    """Import built-in adapter classes on first attribute access (PEP 562)"""
+    if name in _BUILTIN_ADAPTERS:
+        import importlib
+
+        module = importlib.import_module(_BUILTIN_ADAPTERS[name][1])
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = "0.1.0"
 __all__ = [
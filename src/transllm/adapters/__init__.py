@@ -1,7 +1,23 @@
 """Adapters for various LLM providers"""
 
-from .openai import OpenAIAdapter
-from .anthropic import AnthropicAdapter
-from .gemini import GeminiAdapter
+import importlib
+
+_ADAPTER_MODULES = {
+    "OpenAIAdapter": ".openai",
+    "AnthropicAdapter": ".anthropic",
+    "GeminiAdapter": ".gemini",
+}
+
+
+def __getattr__(name: str):
+    """Import adapter classes on first attribute access (PEP 562)
+
+    Importing one adapter subpackage no longer loads the other providers.
+    """
+    if name in _ADAPTER_MODULES:
+        module = importlib.import_module(_ADAPTER_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["OpenAIAdapter", "AnthropicAdapter", "GeminiAdapter"]
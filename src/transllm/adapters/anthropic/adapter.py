@@ -14,13 +14,16 @@ Key design decisions based on litellm analysis:
 from __future__ import annotations
 
 import uuid
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence
 
 from ...core.base_adapter import BaseAdapter
+from ...core.stream_event import StreamEventFast, ToolCallDeltaDict
 from ...core.schema import (
     CoreRequest,
     CoreResponse,
     StreamEvent,
+    StreamEventType,
     Message,
     Choice,
     ResponseMessage,
@@ -35,6 +38,15 @@ from ...core.schema import (
     Provider,
 )
 
+# Anthropic beta feature flags added by _add_beta_headers
+_BETA_PROMPT_CACHING = "prompt-caching-2024-07-31"
+_BETA_INTERLEAVED_THINKING = "interleaved-thinking-2025-05-14"
+_BETA_ADVANCED_TOOL_USE = "advanced-tool-use-2025-11-20"
+
+# Shared read-only stand-in for absent metadata/error mappings, so lookups
+# on events without them do not allocate an empty dict per event
+_EMPTY_MAP: Mapping[str, Any] = MappingProxyType({})
+
 
 class AnthropicAdapter(BaseAdapter):
     """Adapter for Anthropic Claude API format
@@ -46,22 +58,28 @@ class AnthropicAdapter(BaseAdapter):
     - Tool calls use tool_use content blocks instead of tool_calls array
     """
 
+    __slots__ = ("_handlers", "_delta_handlers")
+
+    # Map of finish_reason conversions: Anthropic → unified (OpenAI)
+    finish_reason_map = {
+        "end_turn": "stop",
+        "max_tokens": "length",
+        "stop_sequence": "stop",
+        "tool_use": "tool_calls",
+    }
+    # Reverse map: unified (OpenAI) → Anthropic
+    reverse_finish_reason_map = {
+        "stop": "end_turn",
+        "length": "max_tokens",
+        "content_filter": "stop_sequence",
+        "tool_calls": "tool_use",
+    }
+
     def __init__(self, provider_name: Provider = Provider.anthropic) -> None:
         super().__init__(provider_name)
-        # Map of finish_reason conversions: Anthropic → unified (OpenAI)
-        self.finish_reason_map = {
-            "end_turn": "stop",
-            "max_tokens": "length",
-            "stop_sequence": "stop",
-            "tool_use": "tool_calls",
-        }
-        # Reverse map: unified (OpenAI) → Anthropic
-        self.reverse_finish_reason_map = {
-            "stop": "end_turn",
-            "length": "max_tokens",
-            "content_filter": "stop_sequence",
-            "tool_calls": "tool_use",
-        }
+        # Stream handler table bound on the instance to skip the class lookup
+        self._handlers = self._STREAM_EVENT_HANDLERS
+        self._delta_handlers = self._STREAM_DELTA_HANDLERS
 
     def to_unified_request(self, data: dict[str, Any]) -> CoreRequest:
         """Convert Anthropic request to unified IR format"""
@@ -170,11 +188,8 @@ class AnthropicAdapter(BaseAdapter):
                 if isinstance(msg.content, str):
                     system_messages_content.append(msg.content)
                 elif isinstance(msg.content, list) and msg.content:
-                    # Handle content blocks
-                    text_parts = []
-                    for block in msg.content:
-                        if hasattr(block, "text") and block.text:
-                            text_parts.append(block.text)
+                    # Handle content blocks (validated as ContentBlock by Message)
+                    text_parts = [block.text for block in msg.content if block.text]
                     if text_parts:
                         system_messages_content.append("".join(text_parts))
             else:
@@ -613,11 +628,12 @@ class AnthropicAdapter(BaseAdapter):
 
     def _extract_text_from_content_blocks(self, blocks: list[dict[str, Any]]) -> str:
         """Extract text from content blocks"""
-        texts = []
-        for block in blocks:
-            if isinstance(block, dict) and block.get("type") == "text":
-                texts.append(block.get("text", ""))
-        return "\n".join(texts) if texts else ""
+        texts = [
+            block.get("text", "")
+            for block in blocks
+            if isinstance(block, dict) and block.get("type") == "text"
+        ]
+        return "\n".join(texts)
 
     def _extract_tool_calls_from_content(
         self, content: list[ContentBlock]
@@ -770,7 +786,7 @@ class AnthropicAdapter(BaseAdapter):
 
     def _to_unified_stream_event_impl(
         self, data: dict[str, Any], sequence_id: int, timestamp: float
-    ) -> StreamEvent:
+    ) -> StreamEventFast:
         """Convert Anthropic stream event to unified IR format
 
         Anthropic uses different event types:
@@ -779,102 +795,207 @@ class AnthropicAdapter(BaseAdapter):
         - content_block_stop: end of content block
         - message_start: start of message (contains model info)
         - message_stop: end of message
-        """
-        event_type = data.get("type", "")
-        content_index = data.get("index", 0)
-
-        # Handle content block events
-        if event_type == "content_block_delta":
-            delta = data.get("delta", {})
-            delta_type = delta.get("type", "")
-
-            if delta_type == "text_delta":
-                # Convert to unified content_delta event
-                return StreamEvent(
-                    type="content_delta",
-                    sequence_id=sequence_id,
-                    timestamp=timestamp,
-                    content_delta=delta.get("text", ""),
-                    content_index=content_index,
-                    metadata=data.get("metadata"),
-                )
-            elif delta_type == "input_json_delta":
-                # Tool call input being streamed
-                return StreamEvent(
-                    type="tool_call_delta",
-                    sequence_id=sequence_id,
-                    timestamp=timestamp,
-                    tool_call_delta={
-                        "arguments_delta": delta.get("partial_json", ""),
-                    },
-                    content_index=content_index,
-                    metadata=data.get("metadata"),
-                )
 
-        elif event_type == "content_block_start":
-            # Just track the start - no content to emit yet
-            content_block = data.get("content_block", {})
-            cb_type = content_block.get("type", "text")
-
-            return StreamEvent(
-                type="metadata_update",
-                sequence_id=sequence_id,
-                timestamp=timestamp,
-                content_index=content_index,
-                metadata={
-                    "event": "content_block_start",
-                    "content_block_type": cb_type,
-                },
-            )
+        Each event type is dispatched through _STREAM_EVENT_HANDLERS; a handler
+        returns None for events it cannot convert, which then fall back to a
+        generic metadata_update event.
 
-        elif event_type == "content_block_stop":
-            # Mark end of content block
-            return StreamEvent(
-                type="content_finish",
-                sequence_id=sequence_id,
-                timestamp=timestamp,
-                content_index=content_index,
-                metadata={"event": "content_block_stop"},
+        Events are built as unvalidated StreamEventFast instances; call
+        to_pydantic() on them where a validated StreamEvent is required.
+        """
+        handler = self._handlers.get(data.get("type", ""))
+        if handler is not None:
+            event = handler(self, data, sequence_id, timestamp)
+            if event is not None:
+                return event
+        return self._stream_unknown_event(data, sequence_id, timestamp)
+
+    def to_unified_stream_events(
+        self, events: Sequence[dict[str, Any]]
+    ) -> list[StreamEventFast]:
+        """Convert a batch of Anthropic stream events to unified IR format
+
+        Same result as the BaseAdapter batch method, with handler dispatch
+        inlined into one loop over local bindings.
+
+        Args:
+            events: Anthropic stream events, in stream order
+
+        Returns:
+            Unified stream events, one per input event
+        """
+        first_sequence_id, offset_ns = self._reserve_stream_batch(len(events))
+        handlers = self._handlers
+        unknown_event = self._stream_unknown_event
+
+        converted: list[StreamEventFast] = [None] * len(events)  # type: ignore[list-item]
+        for i, data in enumerate(events):
+            sequence_id = first_sequence_id + i
+            timestamp = (offset_ns + i) * 1e-9
+            handler = handlers.get(data.get("type", ""))
+            event = (
+                handler(self, data, sequence_id, timestamp)
+                if handler is not None
+                else None
             )
-
-        elif event_type == "message_start":
-            # Message start with model info
-            message = data.get("message", {})
-            return StreamEvent(
-                type="metadata_update",
-                sequence_id=sequence_id,
-                timestamp=timestamp,
-                metadata={
-                    "event": "message_start",
-                    "message_id": message.get("id"),
-                    "model": message.get("model"),
-                },
+            converted[i] = (
+                event
+                if event is not None
+                else unknown_event(data, sequence_id, timestamp)
             )
+        return converted
 
-        elif event_type == "message_stop":
-            # Message complete
-            return StreamEvent(
-                type="stream_end",
-                sequence_id=sequence_id,
-                timestamp=timestamp,
-                metadata={"event": "message_stop"},
-            )
+    def _stream_content_block_delta(
+        self, data: dict[str, Any], sequence_id: int, timestamp: float
+    ) -> StreamEventFast | None:
+        """Handle content_block_delta: incremental text or tool input
 
-        # Default fallback
-        return StreamEvent(
-            type="metadata_update",
+        The delta is dispatched on its type through _STREAM_DELTA_HANDLERS;
+        a missing or malformed delta and unhandled delta types (e.g.
+        thinking_delta) return None.
+        """
+        delta = data.get("delta")
+        if not isinstance(delta, dict):
+            return None
+        handler = self._delta_handlers.get(delta.get("type", ""))
+        if handler is None:
+            return None
+        return handler(data, delta, sequence_id, timestamp)
+
+    @staticmethod
+    def _stream_text_delta(
+        data: dict[str, Any],
+        delta: dict[str, Any],
+        sequence_id: int,
+        timestamp: float,
+    ) -> StreamEventFast:
+        """Handle a text_delta: convert to a unified content_delta event"""
+        return StreamEventFast(
+            type=StreamEventType.content_delta,
             sequence_id=sequence_id,
             timestamp=timestamp,
-            metadata={"event": event_type, "raw": data},
+            content_delta=delta.get("text", ""),
+            content_index=data.get("index", 0),
+            metadata=data.get("metadata"),
         )
 
-    def from_unified_stream_event(self, unified_event: StreamEvent) -> dict[str, Any]:
+    @staticmethod
+    def _stream_input_json_delta(
+        data: dict[str, Any],
+        delta: dict[str, Any],
+        sequence_id: int,
+        timestamp: float,
+    ) -> StreamEventFast:
+        """Handle an input_json_delta: tool call input being streamed"""
+        return StreamEventFast(
+            type=StreamEventType.tool_call_delta,
+            sequence_id=sequence_id,
+            timestamp=timestamp,
+            tool_call_delta=ToolCallDeltaDict(
+                arguments_delta=delta.get("partial_json", ""),
+            ),
+            content_index=data.get("index", 0),
+            metadata=data.get("metadata"),
+        )
+
+    def _stream_content_block_start(
+        self, data: dict[str, Any], sequence_id: int, timestamp: float
+    ) -> StreamEventFast:
+        """Handle content_block_start: just track the start, no content yet"""
+        content_block = data.get("content_block")
+        cb_type = (
+            content_block.get("type", "text")
+            if isinstance(content_block, dict)
+            else "text"
+        )
+
+        return StreamEventFast(
+            type=StreamEventType.metadata_update,
+            sequence_id=sequence_id,
+            timestamp=timestamp,
+            content_index=data.get("index", 0),
+            metadata={
+                "event": "content_block_start",
+                "content_block_type": cb_type,
+            },
+        )
+
+    def _stream_content_block_stop(
+        self, data: dict[str, Any], sequence_id: int, timestamp: float
+    ) -> StreamEventFast:
+        """Handle content_block_stop: mark end of content block"""
+        return StreamEventFast(
+            type=StreamEventType.content_finish,
+            sequence_id=sequence_id,
+            timestamp=timestamp,
+            content_index=data.get("index", 0),
+            metadata={"event": "content_block_stop"},
+        )
+
+    def _stream_message_start(
+        self, data: dict[str, Any], sequence_id: int, timestamp: float
+    ) -> StreamEventFast:
+        """Handle message_start: message start with model info"""
+        message = data.get("message")
+        if not isinstance(message, dict):
+            message = _EMPTY_MAP
+        return StreamEventFast(
+            type=StreamEventType.metadata_update,
+            sequence_id=sequence_id,
+            timestamp=timestamp,
+            metadata={
+                "event": "message_start",
+                "message_id": message.get("id"),
+                "model": message.get("model"),
+            },
+        )
+
+    def _stream_message_stop(
+        self, data: dict[str, Any], sequence_id: int, timestamp: float
+    ) -> StreamEventFast:
+        """Handle message_stop: message complete"""
+        return StreamEventFast(
+            type=StreamEventType.stream_end,
+            sequence_id=sequence_id,
+            timestamp=timestamp,
+            metadata={"event": "message_stop"},
+        )
+
+    def _stream_unknown_event(
+        self, data: dict[str, Any], sequence_id: int, timestamp: float
+    ) -> StreamEventFast:
+        """Default fallback: pass the raw event through as metadata"""
+        return StreamEventFast(
+            type=StreamEventType.metadata_update,
+            sequence_id=sequence_id,
+            timestamp=timestamp,
+            metadata={"event": data.get("type", ""), "raw": data},
+        )
+
+    # Anthropic stream event type -> handler, looked up once per event
+    _STREAM_EVENT_HANDLERS = {
+        "content_block_delta": _stream_content_block_delta,
+        "content_block_start": _stream_content_block_start,
+        "content_block_stop": _stream_content_block_stop,
+        "message_start": _stream_message_start,
+        "message_stop": _stream_message_stop,
+    }
+
+    # content_block_delta delta type -> handler(data, delta, sequence_id, timestamp)
+    _STREAM_DELTA_HANDLERS = {
+        "text_delta": _stream_text_delta,
+        "input_json_delta": _stream_input_json_delta,
+    }
+
+    def from_unified_stream_event(
+        self, unified_event: StreamEvent | StreamEventFast
+    ) -> dict[str, Any]:
         """Convert unified IR stream event to Anthropic format
 
         Maps unified event types back to Anthropic event format
         """
-        # Extract metadata if present
-        metadata = unified_event.metadata or {}
+        # Extract metadata if present (read-only; never emitted directly)
+        metadata = unified_event.metadata or _EMPTY_MAP
 
         # Get event type as string for comparison (handle both enum and string)
         event_type = (
@@ -899,9 +1020,9 @@ class AnthropicAdapter(BaseAdapter):
             tc_delta = unified_event.tool_call_delta or {}
             # Handle both dict and Pydantic model for tool_call_delta
             arguments_delta = (
-                tc_delta.arguments_delta
-                if hasattr(tc_delta, "arguments_delta")
-                else tc_delta.get("arguments_delta", "")
+                tc_delta.get("arguments_delta", "")
+                if isinstance(tc_delta, dict)
+                else tc_delta.arguments_delta
             )
             return {
                 "type": "content_block_delta",
@@ -949,12 +1070,12 @@ class AnthropicAdapter(BaseAdapter):
                 # Generic metadata event
                 return {
                     "type": event_name or "metadata_update",
-                    "metadata": metadata,
+                    "metadata": unified_event.metadata or {},
                 }
 
         # Error event
         elif event_type == "error":
-            error = unified_event.error or {}
+            error = unified_event.error or _EMPTY_MAP
             return {
                 "type": "error",
                 "error": {
@@ -966,7 +1087,7 @@ class AnthropicAdapter(BaseAdapter):
         # Default fallback
         return {
             "type": "metadata_update",
-            "metadata": metadata,
+            "metadata": unified_event.metadata or {},
         }
 
     def _add_beta_headers(self, request: dict[str, Any]) -> None:
@@ -979,29 +1100,30 @@ class AnthropicAdapter(BaseAdapter):
 
         # 1. Check for prompt caching (cache_control can appear in multiple places)
         if self._has_cache_control(request):
-            headers.add("prompt-caching-2024-07-31")
+            headers.add(_BETA_PROMPT_CACHING)
 
         # 2. Check for thinking/extended thinking
         if "thinking" in request:
-            headers.add("interleaved-thinking-2025-05-14")
+            headers.add(_BETA_INTERLEAVED_THINKING)
 
         # 3. Check for advanced tool use
         if "tools" in request and request["tools"]:
-            headers.add("advanced-tool-use-2025-11-20")
+            headers.add(_BETA_ADVANCED_TOOL_USE)
 
-        # 4. Check for vision/multimodal content
-        if self._has_vision_content(request):
-            # Vision is not a beta feature anymore, but we can track it
-            pass
+        # 4. Vision/multimodal content is not a beta feature anymore, so no scan
+        #    of the messages is needed here
 
         # 5. Check for specific tool features (computer, hosted, MCP, etc.)
-        if self._has_advanced_tool_types(request):
+        #    Only needed when step 3 has not already added the same beta
+        if _BETA_ADVANCED_TOOL_USE not in headers and self._has_advanced_tool_types(
+            request
+        ):
             # Computer and other advanced tool use
-            headers.add("advanced-tool-use-2025-11-20")
+            headers.add(_BETA_ADVANCED_TOOL_USE)
 
         # Convert set to sorted list for consistent output
         if headers:
-            request["betas"] = sorted(list(headers))
+            request["betas"] = sorted(headers)
 
     def _has_cache_control(self, request: dict[str, Any]) -> bool:
         """Check if request uses cache_control in any location"""
@@ -1036,23 +1158,6 @@ class AnthropicAdapter(BaseAdapter):
 
         return False
 
-    def _has_vision_content(self, request: dict[str, Any]) -> bool:
-        """Check if request contains vision/image content"""
-        if "messages" in request:
-            for msg in request["messages"]:
-                if "content" in msg:
-                    content = msg["content"]
-                    # Check for image blocks in list format
-                    if isinstance(content, list):
-                        for block in content:
-                            if isinstance(block, dict) and block.get("type") == "image":
-                                return True
-                    # Check for image key in dict content (shouldn't happen but be safe)
-                    elif isinstance(content, dict) and "image" in content:
-                        return True
-
-        return False
-
     def _has_advanced_tool_types(self, request: dict[str, Any]) -> bool:
         """Check if request uses advanced tool types (computer, hosted, MCP, etc.)
 
@@ -3,12 +3,52 @@
 from __future__ import annotations
 
 import base64
+import binascii
 import mimetypes
 import re
+import threading
 import uuid
-from typing import Any, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set
 from urllib.parse import urlparse
 
+if TYPE_CHECKING:
+    import httpx
+
+_DATA_URI_PREFIX_RE = re.compile(r"data:([^;]+)")
+_DATA_URI_FULL_RE = re.compile(r"data:([^;]+);base64,(.+)")
+
+# base64 of b"toolcall:"; 9 bytes encode to exactly 12 chars with no padding
+_TOOLCALL_SIGNATURE_PREFIX = "dG9vbGNhbGw6"
+
+# Shared client for image downloads, created on first use so httpx stays optional
+_http_client: Optional["httpx.Client"] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> "httpx.Client":
+    """Get the process-wide HTTP client used to fetch remote images
+
+    Reusing one pooled client keeps connections alive between downloads
+    instead of paying a TCP/TLS handshake per image.
+
+    Returns:
+        Shared httpx.Client instance
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            # Re-check under the lock so concurrent first calls build one client
+            if _http_client is None:
+                import httpx
+
+                _http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=100, max_keepalive_connections=50
+                    ),
+                    timeout=10.0,
+                )
+    return _http_client
+
 
 def is_http_url(url: str) -> bool:
     """Check if URL is HTTP/HTTPS
@@ -19,8 +59,8 @@ def is_http_url(url: str) -> bool:
     Returns:
         True if URL is HTTP/HTTPS
     """
-    parsed = urlparse(url)
-    return parsed.scheme in ["http", "https"]
+    # URL schemes are case-insensitive; only the prefix needs lowering
+    return url[:8].lower().startswith(("http://", "https://"))
 
 
 def is_base64_data(url: str) -> bool:
@@ -45,15 +85,12 @@ def detect_media_type(url: str) -> Optional[str]:
         Media type string or None
     """
     if is_base64_data(url):
-        # Extract from data URI
-        match = re.match(r"data:([^;]+)", url)
-        if match:
-            return match.group(1)
+        # Extract from data URI (a data URI has no path to guess from)
+        match = _DATA_URI_PREFIX_RE.match(url)
+        return match.group(1) if match else None
 
-    # Try to detect from URL extension
-    parsed = urlparse(url)
-    path = parsed.path
-    media_type, _ = mimetypes.guess_type(path)
+    # Try to detect from URL extension (urlparse drops query and fragment)
+    media_type, _ = mimetypes.guess_type(urlparse(url).path)
     return media_type
 
 
@@ -75,7 +112,7 @@ def convert_image_url_to_gemini(
     """
     if is_base64_data(image_url):
         # Base64 data URI → inline_data
-        match = re.match(r"data:([^;]+);base64,(.+)", image_url)
+        match = _DATA_URI_FULL_RE.match(image_url)
         if match:
             media_type = match.group(1)
             data = match.group(2)
@@ -84,21 +121,18 @@ def convert_image_url_to_gemini(
         # Google AI Studio doesn't support HTTP URLs directly
         # Automatically download and convert to base64 (like litellm does)
         try:
-            import httpx
-            import base64
+            # Stream the download (10 second timeout) so the raw image is
+            # encoded chunk by chunk instead of being held in full first
+            with _get_http_client().stream("GET", image_url, timeout=10.0) as response:
+                response.raise_for_status()
 
-            # Download image with 10 second timeout
-            response = httpx.get(image_url, timeout=10.0)
-            response.raise_for_status()
+                # Detect MIME type (prefer Content-Type header)
+                content_type = response.headers.get("content-type", "image/jpeg")
+                if not content_type.startswith("image/"):
+                    # Fallback: guess from URL
+                    content_type = detect_media_type(image_url) or "image/jpeg"
 
-            # Detect MIME type (prefer Content-Type header)
-            content_type = response.headers.get("content-type", "image/jpeg")
-            if not content_type.startswith("image/"):
-                # Fallback: guess from URL
-                content_type = detect_media_type(image_url) or "image/jpeg"
-
-            # Convert to base64
-            base64_data = base64.b64encode(response.content).decode("utf-8")
+                base64_data = _b64encode_chunks(response.iter_bytes())
 
             # Return inline_data format (supported by Google AI Studio)
             return {"inline_data": {"mime_type": content_type, "data": base64_data}}
@@ -117,6 +151,34 @@ def convert_image_url_to_gemini(
     raise ValueError(f"Unable to process image URL: {image_url}")
 
 
+def _b64encode_chunks(chunks: Iterable[bytes]) -> str:
+    """Base64-encode a stream of byte chunks incrementally
+
+    Each chunk is encoded as soon as it arrives; only the 0-2 trailing bytes
+    that do not fill a 3-byte group are carried over to the next chunk, so
+    the result is identical to encoding the concatenated bytes at once.
+    The output is appended to a single bytearray and decoded once, so at
+    most two copies of the encoded data are alive at the same time.
+
+    Args:
+        chunks: Iterable of raw byte chunks
+
+    Returns:
+        Base64 string of the concatenated chunks
+    """
+    encoded = bytearray()
+    remainder = b""
+    for chunk in chunks:
+        if remainder:
+            chunk = remainder + chunk
+        cut = len(chunk) - len(chunk) % 3
+        encoded += base64.b64encode(memoryview(chunk)[:cut])
+        remainder = chunk[cut:]
+    if remainder:
+        encoded += base64.b64encode(remainder)
+    return encoded.decode("ascii")
+
+
 def generate_tool_call_id() -> str:
     """Generate unique tool call ID for Gemini
 
@@ -139,13 +201,14 @@ def decode_thought_signature(signature: str) -> Optional[str]:
     Returns:
         Original tool call ID or None if invalid
     """
+    # Real Gemini signatures are large opaque blobs; skip decoding them
+    if not signature.startswith(_TOOLCALL_SIGNATURE_PREFIX):
+        return None
     try:
-        decoded = base64.b64decode(signature.encode()).decode()
-        if decoded.startswith("toolcall:"):
-            return decoded.split(":", 1)[1]
-    except Exception:
-        pass
-    return None
+        decoded = base64.b64decode(signature).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    return decoded.split(":", 1)[1]
 
 
 def is_candidate_token_count_inclusive(
@@ -188,44 +251,42 @@ def merge_duplicate_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, A
     Returns:
         Merged messages list
     """
-    if not messages:
-        return []
-
-    merged = []
-    current = messages[0].copy()
-    current_parts = []
-
-    # Extract parts if present
-    if isinstance(current.get("parts"), list):
-        current_parts = current["parts"]
-        # Remove parts from current to process separately
-        current = {k: v for k, v in current.items() if k != "parts"}
-
-    for msg in messages[1:]:
-        if msg.get("role") == current.get("role"):
-            # Same role - merge parts
-            if isinstance(msg.get("parts"), list):
-                current_parts.extend(msg["parts"])
-        else:
-            # Different role - save current and start new
-            if current_parts and "parts" not in current:
+    merged: List[Dict[str, Any]] = []
+    current: Optional[Dict[str, Any]] = None
+    current_parts: List[Any] = []
+    owns_parts = False
+
+    for msg in messages:
+        parts = msg.get("parts")
+
+        if current is not None and msg.get("role") == current.get("role"):
+            # Same role - merge parts (copy the borrowed list before first extend)
+            if isinstance(parts, list):
+                if not owns_parts:
+                    current_parts = list(current_parts)
+                    owns_parts = True
+                current_parts.extend(parts)
+            continue
+
+        if current is not None:
+            if current_parts:
                 current["parts"] = current_parts
-            elif current_parts:
-                current["parts"].extend(current_parts)
             merged.append(current)
 
-            current = msg.copy()
+        # Different role - copy once and borrow its parts list
+        current = msg.copy()
+        owns_parts = False
+        if isinstance(parts, list):
+            del current["parts"]
+            current_parts = parts
+        else:
             current_parts = []
-            if isinstance(current.get("parts"), list):
-                current_parts = current["parts"]
-                current = {k: v for k, v in current.items() if k != "parts"}
 
     # Don't forget the last message
-    if current_parts and "parts" not in current:
-        current["parts"] = current_parts
-    elif current_parts:
-        current["parts"].extend(current_parts)
-    merged.append(current)
+    if current is not None:
+        if current_parts:
+            current["parts"] = current_parts
+        merged.append(current)
 
     return merged
 
@@ -271,46 +332,58 @@ def detect_circular_reference(
 ) -> bool:
     """Detect circular references in nested objects
 
+    Walks the structure iteratively, keeping the ids of the containers on the
+    current path in a single shared set. Objects that are merely shared between
+    branches are not reported as circular.
+
     Args:
         obj: Object to check
-        visited: Set of visited object ids
-        depth: Current recursion depth
-        max_depth: Maximum recursion depth
+        visited: Set of container ids already on the path (not modified)
+        depth: Depth of obj in the overall structure
+        max_depth: Maximum nesting depth
 
     Returns:
         True if circular reference detected
 
     Raises:
-        ValueError: If circular reference or max depth exceeded
+        ValueError: If max depth exceeded
     """
-    if visited is None:
-        visited = set()
-
     if depth > max_depth:
         raise ValueError(f"Max recursion depth ({max_depth}) exceeded")
 
-    obj_id = id(obj)
-    if obj_id in visited:
+    on_path = set(visited) if visited else set()
+    if id(obj) in on_path:
         return True
+    if not isinstance(obj, (dict, list)):
+        return False
 
-    if isinstance(obj, (dict, list)):
-        visited.add(obj_id)
-
-        try:
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if detect_circular_reference(
-                        value, visited.copy(), depth + 1, max_depth
-                    ):
-                        return True
-            elif isinstance(obj, list):
-                for item in obj:
-                    if detect_circular_reference(
-                        item, visited.copy(), depth + 1, max_depth
-                    ):
-                        return True
-        finally:
-            visited.discard(obj_id)
+    on_path.add(id(obj))
+    stack = [(id(obj), iter(obj.values() if isinstance(obj, dict) else obj))]
+
+    while stack:
+        node_id, children = stack[-1]
+        child_depth = depth + len(stack)
+        for child in children:
+            if child_depth > max_depth:
+                raise ValueError(f"Max recursion depth ({max_depth}) exceeded")
+
+            child_id = id(child)
+            if child_id in on_path:
+                return True
+
+            if isinstance(child, (dict, list)):
+                # Descend; the parent iterator resumes once this child is done
+                on_path.add(child_id)
+                stack.append(
+                    (
+                        child_id,
+                        iter(child.values() if isinstance(child, dict) else child),
+                    )
+                )
+                break
+        else:
+            stack.pop()
+            on_path.discard(node_id)
 
     return False
 
@@ -6,6 +6,7 @@ import json
 from typing import Any
 
 from ...core.base_adapter import BaseAdapter
+from ...core.stream_event import StreamEventFast
 from ...core.schema import (
     CoreRequest,
     CoreResponse,
@@ -700,7 +701,9 @@ class OpenAIAdapter(BaseAdapter):
             metadata=data.get("metadata"),
         )
 
-    def from_unified_stream_event(self, unified_event: StreamEvent) -> dict[str, Any]:
+    def from_unified_stream_event(
+        self, unified_event: StreamEvent | StreamEventFast
+    ) -> dict[str, Any]:
         """Convert unified IR stream event to OpenAI format"""
         # OpenAI uses delta chunks
         delta = {}
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 
 from src.transllm.core.schema import Provider
+from ..core.serialization import canonical_dumps
 from ..utils.provider_registry import ProviderRegistry
+from ..utils.toon import encode_tool_results
 from ..core.exceptions import ConversionError, UnsupportedProviderError
 
 
@@ -17,6 +19,7 @@ class RequestConverter:
         data: dict[str, Any],
         from_provider: Provider,
         to_provider: Provider,
+        tool_result_encoding: Literal["json", "toon"] = "json",
     ) -> dict[str, Any]:
         """Convert request from one provider format to another
 
@@ -24,6 +27,9 @@ class RequestConverter:
             data: Request data in source provider format
             from_provider: Source provider (Provider enum)
             to_provider: Target provider (Provider enum)
+            tool_result_encoding: "toon" re-encodes tool results that are
+                uniform arrays of objects as TOON tables to save input tokens;
+                "json" (default) leaves them untouched
 
         Returns:
             Request data in target provider format
@@ -33,12 +39,19 @@ class RequestConverter:
             >>> RequestConverter.convert(data, Provider.openai, Provider.anthropic)
 
         Raises:
+            ValueError: If tool_result_encoding is not "json" or "toon"
             UnsupportedProviderError: If provider is not supported
             ConversionError: If conversion fails
         """
+        if tool_result_encoding not in ("json", "toon"):
+            raise ValueError(
+                f"Unsupported tool_result_encoding: {tool_result_encoding!r}. "
+                "Expected 'json' or 'toon'"
+            )
+
         # Get adapters
         try:
-            from_adapter = ProviderRegistry.get_adapter(from_provider)
+            from_adapter = ProviderRegistry.get_shared_adapter(from_provider)
         except UnsupportedProviderError:
             raise UnsupportedProviderError(
                 from_provider,
@@ -46,7 +59,7 @@ class RequestConverter:
             )
 
         try:
-            to_adapter = ProviderRegistry.get_adapter(to_provider)
+            to_adapter = ProviderRegistry.get_shared_adapter(to_provider)
         except UnsupportedProviderError:
             raise UnsupportedProviderError(
                 to_provider,
@@ -60,11 +73,14 @@ class RequestConverter:
             # Convert to target format
             converted_request = to_adapter.from_unified_request(unified_request)
 
+            if tool_result_encoding == "toon":
+                encode_tool_results(converted_request)
+
             return converted_request
 
+        except ConversionError:
+            raise
         except Exception as e:
-            if isinstance(e, ConversionError):
-                raise
             raise ConversionError(
                 f"Failed to convert request from {from_provider.value} to {to_provider.value}",
                 from_provider,
@@ -87,46 +103,17 @@ class RequestConverter:
             True if idempotent, False otherwise
         """
         try:
-            converter = RequestConverter()
-            # Convert to IR and back
-            intermediate = converter.convert(data, provider, provider)
+            # Resolve the adapter once and round-trip through it directly
+            adapter = ProviderRegistry.get_shared_adapter(provider)
+            intermediate = adapter.from_unified_request(
+                adapter.to_unified_request(data)
+            )
 
-            # Compare (simple deep comparison)
-            return converter._deep_compare(data, intermediate)
+            # Compare canonical serializations: dict key order is ignored,
+            # lists compare as multisets and enums by value
+            return intermediate is data or canonical_dumps(data) == canonical_dumps(
+                intermediate
+            )
 
         except Exception:
             return False
-
-    @staticmethod
-    def _deep_compare(obj1: Any, obj2: Any, path: str = "") -> bool:
-        """Deep comparison of two objects with enum handling"""
-        # Handle enum comparison
-        if hasattr(obj1, "value") and hasattr(obj2, "value"):
-            return obj1.value == obj2.value
-        if hasattr(obj1, "value") or hasattr(obj2, "value"):
-            # One is enum, one is not - compare enum value with the other
-            val1 = obj1.value if hasattr(obj1, "value") else obj1
-            val2 = obj2.value if hasattr(obj2, "value") else obj2
-            return val1 == val2
-
-        if type(obj1) != type(obj2):
-            return False
-
-        if isinstance(obj1, dict):
-            # For dicts, compare values recursively
-            if set(obj1.keys()) != set(obj2.keys()):
-                return False
-            return all(
-                RequestConverter._deep_compare(obj1[k], obj2[k], f"{path}.{k}")
-                for k in obj1.keys()
-            )
-
-        if isinstance(obj1, (list, tuple)):
-            if len(obj1) != len(obj2):
-                return False
-            # For lists, compare as multisets (order-independent for most cases)
-            obj1_str = sorted(str(item) for item in obj1)
-            obj2_str = sorted(str(item) for item in obj2)
-            return obj1_str == obj2_str
-
-        return obj1 == obj2
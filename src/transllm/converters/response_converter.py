@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from enum import Enum
 from typing import Any
 
 from src.transllm.core.schema import Provider
+from ..core.serialization import canonical_dumps
 from ..utils.provider_registry import ProviderRegistry
 from ..core.exceptions import ConversionError, UnsupportedProviderError
 
@@ -38,7 +40,7 @@ class ResponseConverter:
         """
         # Get adapters
         try:
-            from_adapter = ProviderRegistry.get_adapter(from_provider)
+            from_adapter = ProviderRegistry.get_shared_adapter(from_provider)
         except UnsupportedProviderError:
             raise UnsupportedProviderError(
                 from_provider,
@@ -46,7 +48,7 @@ class ResponseConverter:
             )
 
         try:
-            to_adapter = ProviderRegistry.get_adapter(to_provider)
+            to_adapter = ProviderRegistry.get_shared_adapter(to_provider)
         except UnsupportedProviderError:
             raise UnsupportedProviderError(
                 to_provider,
@@ -62,9 +64,9 @@ class ResponseConverter:
 
             return converted_response
 
+        except ConversionError:
+            raise
         except Exception as e:
-            if isinstance(e, ConversionError):
-                raise
             raise ConversionError(
                 f"Failed to convert response from {from_provider.value} to {to_provider.value}",
                 from_provider,
@@ -76,12 +78,18 @@ class ResponseConverter:
     def check_idempotency(
         data: dict[str, Any],
         provider: Provider,
+        strict: bool = False,
     ) -> bool:
         """Check if conversion is idempotent (A -> IR -> A)
 
+        By default the original and round-tripped responses are compared by
+        their canonical serializations (see canonical_dumps). Pass
+        strict=True for the recursive comparison instead.
+
         Args:
             data: Response data
             provider: Provider name
+            strict: Compare recursively instead of by canonical bytes
 
         Returns:
             True if idempotent, False otherwise
@@ -91,6 +99,15 @@ class ResponseConverter:
             # Convert to IR and back
             intermediate = converter.convert(data, provider, provider)
 
+            if intermediate is data:
+                return True
+
+            if not strict:
+                # Compare canonical serializations: dict key order is ignored,
+                # lists compare as multisets and enums by value
+                original = canonical_dumps(data)
+                return original == canonical_dumps(intermediate)
+
             # Compare (simple deep comparison)
             return converter._deep_compare(data, intermediate)
 
@@ -100,13 +117,16 @@ class ResponseConverter:
     @staticmethod
     def _deep_compare(obj1: Any, obj2: Any, path: str = "") -> bool:
         """Deep comparison of two objects with enum handling"""
+        if obj1 is obj2:
+            return True
+
         # Handle enum comparison
-        if hasattr(obj1, "value") and hasattr(obj2, "value"):
-            return obj1.value == obj2.value
-        if hasattr(obj1, "value") or hasattr(obj2, "value"):
-            # One is enum, one is not - compare enum value with the other
-            val1 = obj1.value if hasattr(obj1, "value") else obj1
-            val2 = obj2.value if hasattr(obj2, "value") else obj2
+        is_enum1 = isinstance(obj1, Enum)
+        is_enum2 = isinstance(obj2, Enum)
+        if is_enum1 or is_enum2:
+            # Compare enum values; one side may be the raw value
+            val1 = obj1.value if is_enum1 else obj1
+            val2 = obj2.value if is_enum2 else obj2
             return val1 == val2
 
         if type(obj1) != type(obj2):
@@ -114,7 +134,7 @@ class ResponseConverter:
 
         if isinstance(obj1, dict):
             # For dicts, compare values recursively
-            if set(obj1.keys()) != set(obj2.keys()):
+            if len(obj1) != len(obj2) or obj1.keys() != obj2.keys():
                 return False
             return all(
                 ResponseConverter._deep_compare(obj1[k], obj2[k], f"{path}.{k}")
@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Any
+from enum import Enum
+from typing import Any, Callable, Sequence
 
 from src.transllm.core.schema import Provider, StreamEvent
 from ..core import BaseAdapter
+from ..core.serialization import canonical_dumps, json_loads, sorted_dumps
+from ..core.stream_event import StreamEventFast
 from ..utils.provider_registry import ProviderRegistry
-from ..core.exceptions import ConversionError, UnsupportedProviderError
+from ..core.exceptions import ConversionError
+
+# Cached adapter with its bound stream methods:
+# (adapter, to_unified_stream_event, from_unified_stream_event)
+_CachedAdapter = tuple[
+    BaseAdapter,
+    Callable[[dict[str, Any]], StreamEvent | StreamEventFast],
+    Callable[[StreamEvent | StreamEventFast], dict[str, Any]],
+]
 
 
 class StreamConverter:
@@ -20,26 +31,39 @@ class StreamConverter:
     ensuring proper ordering and timing of stream events.
     """
 
+    # Maximum number of check_idempotency() results kept per converter
+    _IDEMPOTENCY_CACHE_SIZE = 1024
+
     def __init__(self) -> None:
-        """Initialize StreamConverter with empty state dictionary"""
-        # State tracking for each provider: {provider: {sequence_id, start_time}}
-        self._adapter_states: dict[Provider, dict[str, Any]] = {}
-        # Cache adapter instances to maintain state across stream events
-        self._cached_adapters: dict[Provider, BaseAdapter] = {}
+        """Initialize StreamConverter with an empty adapter cache"""
+        # Cache adapter instances to maintain state across stream events,
+        # with their stream methods bound once up front
+        self._cached_adapters: dict[Provider, _CachedAdapter] = {}
+        # (to_unified, from_unified) bound method pairs for convert_stream_event()
+        self._adapter_pairs: dict[
+            tuple[Provider, Provider],
+            tuple[
+                Callable[[dict[str, Any]], StreamEvent | StreamEventFast],
+                Callable[[StreamEvent | StreamEventFast], dict[str, Any]],
+            ],
+        ] = {}
+        # check_idempotency() results keyed by (provider, sorted-key JSON)
+        self._idempotency_cache: dict[tuple[Provider, bytes], bool] = {}
 
     def convert_stream_event(
         self,
-        data: dict[str, Any],
+        data: dict[str, Any] | bytes | str,
         from_provider: Provider,
         to_provider: Provider,
     ) -> dict[str, Any]:
         """Convert stream event from one provider format to another
 
-        This is a convenience method that combines to_unified_event() and
-        from_unified_event() in a single call.
+        Equivalent to to_unified_event() followed by from_unified_event(),
+        but both steps run in a single call against a cached adapter pair.
 
         Args:
-            data: Stream event data in source provider format
+            data: Stream event data in source provider format, either parsed
+                or as the raw JSON payload of the event
             from_provider: Source provider (Provider enum)
             to_provider: Target provider (Provider enum)
 
@@ -50,23 +74,118 @@ class StreamConverter:
             UnsupportedProviderError: If provider is not supported
             ConversionError: If conversion fails
         """
-        # Convert to unified format
-        unified_event = self.to_unified_event(data, from_provider)
+        return self._convert_fast(data, from_provider, to_provider)
 
-        # Convert to target format
-        target_event = self.from_unified_event(unified_event, to_provider)
+    def convert_stream_events(
+        self,
+        events: Sequence[dict[str, Any] | bytes | str],
+        from_provider: Provider,
+        to_provider: Provider,
+    ) -> list[dict[str, Any]]:
+        """Convert a batch of stream events from one provider format to another
 
-        return target_event
+        Buffered events go through the source adapter's batch conversion
+        (one clock read and one dispatch loop per batch) instead of one
+        convert_stream_event() call per event.
+
+        Args:
+            events: Stream events in source provider format, in stream order,
+                parsed or as raw JSON payloads
+            from_provider: Source provider (Provider enum)
+            to_provider: Target provider (Provider enum)
+
+        Returns:
+            Stream events in target provider format, one per input event
+
+        Raises:
+            UnsupportedProviderError: If provider is not supported
+            ConversionError: If conversion fails
+        """
+        from_adapter = self._get_cached_entry(from_provider)[0]
+        from_unified = self._get_cached_entry(to_provider)[2]
+
+        try:
+            parsed = [
+                json_loads(data) if isinstance(data, (bytes, str)) else data
+                for data in events
+            ]
+            return [
+                from_unified(unified_event)
+                for unified_event in from_adapter.to_unified_stream_events(parsed)
+            ]
+
+        except ConversionError:
+            raise
+        except Exception as e:
+            raise ConversionError(
+                f"Failed to convert stream events from {from_provider.value} to {to_provider.value}",
+                from_provider,
+                to_provider,
+                {"original_error": str(e)},
+            ) from e
+
+    def _convert_fast(
+        self,
+        data: dict[str, Any] | bytes | str,
+        from_provider: Provider,
+        to_provider: Provider,
+    ) -> dict[str, Any]:
+        """Convert a stream event through the cached (from, to) adapter pair
+
+        Args:
+            data: Stream event data in source provider format, parsed or raw JSON
+            from_provider: Source provider (Provider enum)
+            to_provider: Target provider (Provider enum)
+
+        Returns:
+            Stream event data in target provider format
+
+        Raises:
+            UnsupportedProviderError: If provider is not supported
+            ConversionError: If conversion fails
+        """
+        pair = self._adapter_pairs.get((from_provider, to_provider))
+        if pair is None:
+            pair = (
+                self._get_cached_entry(from_provider)[1],
+                self._get_cached_entry(to_provider)[2],
+            )
+            self._adapter_pairs[(from_provider, to_provider)] = pair
+        to_unified, from_unified = pair
+
+        try:
+            if isinstance(data, (bytes, str)):
+                data = json_loads(data)
+
+            return from_unified(to_unified(data))
+
+        except ConversionError:
+            raise
+        except Exception as e:
+            raise ConversionError(
+                f"Failed to convert stream event from {from_provider.value} to {to_provider.value}",
+                from_provider,
+                to_provider,
+                {"original_error": str(e)},
+            ) from e
 
     def to_unified_event(
         self,
-        data: dict[str, Any],
+        data: dict[str, Any] | bytes | str,
         from_provider: Provider,
     ) -> StreamEvent:
         """Convert stream event from provider format to unified format
 
+        Raw JSON payloads (bytes or str) are parsed straight into plain dicts,
+        so callers holding wire data, or SDK objects that can emit JSON, do not
+        need to build an intermediate dict (e.g. via model_dump()) first.
+
+        Adapters may build unvalidated StreamEventFast events internally;
+        they are validated here, so the result is a StreamEvent for every
+        provider.
+
         Args:
-            data: Stream event data in provider format
+            data: Stream event data in provider format, parsed or raw JSON
             from_provider: Source provider (Provider enum)
 
         Returns:
@@ -77,26 +196,22 @@ class StreamConverter:
             ConversionError: If conversion fails
         """
         # Get or create cached adapter (maintains state across events)
-        try:
-            from_adapter = self._get_cached_adapter(from_provider)
-        except UnsupportedProviderError:
-            raise UnsupportedProviderError(
-                from_provider,
-                ProviderRegistry.list_supported_providers(),
-            )
+        to_unified = self._get_cached_entry(from_provider)[1]
 
         try:
-            # Ensure we have state for this provider
-            self._ensure_provider_state(from_provider)
+            if isinstance(data, (bytes, str)):
+                data = json_loads(data)
 
             # Let the adapter handle the conversion (it will manage state internally)
-            unified_event = from_adapter.to_unified_stream_event(data)
+            unified_event = to_unified(data)
+            if isinstance(unified_event, StreamEventFast):
+                unified_event = unified_event.to_pydantic()
 
             return unified_event
 
+        except ConversionError:
+            raise
         except Exception as e:
-            if isinstance(e, ConversionError):
-                raise
             raise ConversionError(
                 f"Failed to convert stream event from {from_provider.value} to unified format",
                 from_provider,
@@ -106,7 +221,7 @@ class StreamConverter:
 
     def from_unified_event(
         self,
-        unified_event: StreamEvent,
+        unified_event: StreamEvent | StreamEventFast,
         to_provider: Provider,
     ) -> dict[str, Any]:
         """Convert stream event from unified format to provider format
@@ -123,23 +238,17 @@ class StreamConverter:
             ConversionError: If conversion fails
         """
         # Get or create cached adapter (maintains state across events)
-        try:
-            to_adapter = self._get_cached_adapter(to_provider)
-        except UnsupportedProviderError:
-            raise UnsupportedProviderError(
-                to_provider,
-                ProviderRegistry.list_supported_providers(),
-            )
+        from_unified = self._get_cached_entry(to_provider)[2]
 
         try:
             # Convert from unified format
-            target_event = to_adapter.from_unified_stream_event(unified_event)
+            target_event = from_unified(unified_event)
 
             return target_event
 
+        except ConversionError:
+            raise
         except Exception as e:
-            if isinstance(e, ConversionError):
-                raise
             raise ConversionError(
                 f"Failed to convert stream event from unified format to {to_provider.value}",
                 None,  # from_provider is not applicable for this step
@@ -155,79 +264,83 @@ class StreamConverter:
         Args:
             provider: Provider to reset state for
         """
-        if provider in self._adapter_states:
-            del self._adapter_states[provider]
+        self._idempotency_cache = {
+            key: result
+            for key, result in self._idempotency_cache.items()
+            if key[0] is not provider
+        }
         if provider in self._cached_adapters:
             # Reset the cached adapter's internal state
-            self._cached_adapters[provider].reset_stream_state()
+            self._cached_adapters[provider][0].reset_stream_state()
             # Remove from cache to get a fresh adapter next time
             del self._cached_adapters[provider]
+            self._adapter_pairs = {
+                key: pair
+                for key, pair in self._adapter_pairs.items()
+                if provider not in key
+            }
 
     def reset_all_states(self) -> None:
         """Reset stream state for all providers"""
-        self._adapter_states.clear()
         # Reset all cached adapters and clear cache
-        for adapter in self._cached_adapters.values():
+        for adapter, _, _ in self._cached_adapters.values():
             adapter.reset_stream_state()
         self._cached_adapters.clear()
+        self._idempotency_cache.clear()
+        self._adapter_pairs.clear()
 
-    def _ensure_provider_state(self, provider: Provider) -> None:
-        """Ensure provider state is initialized
-
-        Args:
-            provider: Provider to check
-        """
-        if provider not in self._adapter_states:
-            self._adapter_states[provider] = {
-                "_stream_sequence_id": 0,
-                "_stream_start_time": None,
-            }
-
-    def _get_cached_adapter(self, provider: Provider) -> BaseAdapter:
-        """Get or create a cached adapter instance for a provider
-
-        This ensures we use the same adapter instance across multiple stream events,
-        which is critical for maintaining proper sequence_id and timestamp state.
+    def _get_cached_entry(self, provider: Provider) -> _CachedAdapter:
+        """Get or create the cached adapter entry for a provider
 
         Args:
             provider: Provider to get adapter for
 
         Returns:
-            Cached adapter instance
+            Tuple of the cached adapter and its bound
+            to_unified_stream_event / from_unified_stream_event methods
 
         Raises:
             UnsupportedProviderError: If provider is not supported
         """
-        if provider not in self._cached_adapters:
+        entry = self._cached_adapters.get(provider)
+        if entry is None:
             # Create new adapter and cache it
-            if not ProviderRegistry.is_supported(provider):
-                raise UnsupportedProviderError(
-                    provider,
-                    ProviderRegistry.list_supported_providers(),
-                )
-            adapter_class = ProviderRegistry._adapters[provider.value.lower()]
-            self._cached_adapters[provider] = adapter_class(provider)
+            adapter_class = ProviderRegistry.get_adapter_class(provider)
+            adapter = adapter_class(provider)
+            entry = (
+                adapter,
+                adapter.to_unified_stream_event,
+                adapter.from_unified_stream_event,
+            )
+            self._cached_adapters[provider] = entry
 
-        return self._cached_adapters[provider]
+        return entry
 
     def get_provider_state(self, provider: Provider) -> dict[str, Any]:
         """Get the current state for a provider
 
+        The state is read from the provider's cached adapter, which owns it.
+
         Args:
             provider: Provider to get state for
 
         Returns:
-            Dictionary containing sequence_id and start_time
+            Dictionary containing _stream_sequence_id and _stream_start_ns
 
         Raises:
             KeyError: If provider state hasn't been initialized
         """
-        if provider not in self._adapter_states:
+        entry = self._cached_adapters.get(provider)
+        if entry is None:
             raise KeyError(
                 f"Provider state not initialized for {provider.value}. "
                 "Call to_unified_event() first to initialize state."
             )
-        return self._adapter_states[provider]
+        adapter = entry[0]
+        return {
+            "_stream_sequence_id": adapter._stream_sequence_id,
+            "_stream_start_ns": adapter._stream_start_ns,
+        }
 
     def check_idempotency(
         self,
@@ -239,6 +352,11 @@ class StreamConverter:
         Note: This checks if a stream event can be converted to unified format
         and back to the same provider format without loss of information.
 
+        The round trip runs on a throwaway adapter, so it never touches the
+        converter's stream state, and results are memoized per payload in a
+        bounded cache, so repeated payloads skip both conversions. Payloads
+        that are not plain JSON are never cached.
+
         Args:
             data: Stream event data
             provider: Provider to test (Provider enum)
@@ -247,11 +365,40 @@ class StreamConverter:
             True if idempotent, False otherwise
         """
         try:
+            cache_key = (provider, sorted_dumps(data))
+        except (TypeError, ValueError):
+            # Not plain JSON: no collision-free key, so do not cache
+            cache_key = None
+        else:
+            cached = self._idempotency_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        result = self._check_idempotency_uncached(data, provider)
+
+        if cache_key is not None:
+            if len(self._idempotency_cache) >= self._IDEMPOTENCY_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._idempotency_cache[next(iter(self._idempotency_cache))]
+            self._idempotency_cache[cache_key] = result
+        return result
+
+    def _check_idempotency_uncached(
+        self,
+        data: dict[str, Any],
+        provider: Provider,
+    ) -> bool:
+        """Run the A -> IR -> A round trip for check_idempotency()"""
+        try:
+            adapter = ProviderRegistry.get_adapter(provider)
+
             # Convert to unified format
-            unified_event = self.to_unified_event(data, provider)
+            unified_event = adapter.to_unified_stream_event(data)
 
             # Convert back to provider format
-            converted_back = self.from_unified_event(unified_event, provider)
+            converted_back = adapter.from_unified_stream_event(unified_event)
+            if converted_back is data:
+                return True
 
             # Compare (simple deep comparison)
             return self._deep_compare(data, converted_back)
@@ -274,33 +421,24 @@ class StreamConverter:
         Returns:
             True if objects are equivalent, False otherwise
         """
+        if obj1 is obj2:
+            return True
+
         # Handle enum comparison
-        if hasattr(obj1, "value") and hasattr(obj2, "value"):
-            return obj1.value == obj2.value
-        if hasattr(obj1, "value") or hasattr(obj2, "value"):
-            # One is enum, one is not - compare enum value with the other
-            val1 = obj1.value if hasattr(obj1, "value") else obj1
-            val2 = obj2.value if hasattr(obj2, "value") else obj2
+        is_enum1 = isinstance(obj1, Enum)
+        is_enum2 = isinstance(obj2, Enum)
+        if is_enum1 or is_enum2:
+            # Compare enum values; one side may be the raw value
+            val1 = obj1.value if is_enum1 else obj1
+            val2 = obj2.value if is_enum2 else obj2
             return val1 == val2
 
         if type(obj1) != type(obj2):
             return False
 
-        if isinstance(obj1, dict):
-            # For dicts, compare values recursively, ignoring metadata fields
-            if set(obj1.keys()) != set(obj2.keys()):
-                return False
-            return all(
-                StreamConverter._deep_compare(obj1[k], obj2[k], f"{path}.{k}")
-                for k in obj1.keys()
-            )
-
-        if isinstance(obj1, (list, tuple)):
-            if len(obj1) != len(obj2):
-                return False
-            # For lists, compare as multisets (order-independent for most cases)
-            obj1_str = sorted(str(item) for item in obj1)
-            obj2_str = sorted(str(item) for item in obj2)
-            return obj1_str == obj2_str
+        if isinstance(obj1, (dict, list, tuple)):
+            # Compare canonical serializations: dict key order is ignored
+            # and lists compare as multisets (order-independent)
+            return canonical_dumps(obj1) == canonical_dumps(obj2)
 
         return obj1 == obj2
@@ -9,6 +9,7 @@ from .exceptions import (
     ValidationError,
     IdempotencyError,
 )
+from .stream_event import StreamEventBuffer, StreamEventFast, ToolCallDeltaDict
 
 __all__ = [
     "BaseAdapter",
@@ -18,4 +19,7 @@ __all__ = [
     "UnsupportedFeatureError",
     "ValidationError",
     "IdempotencyError",
+    "StreamEventFast",
+    "StreamEventBuffer",
+    "ToolCallDeltaDict",
 ]
@@ -2,6 +2,16 @@
 # Each provider maps their native field names to the brand-neutral IR fields
 # This enables bidirectional conversion between any two providers
 
+from functools import lru_cache
+
+from .schema import Provider
+
+# Registry key of each provider, precomputed instead of calling
+# .value.lower() on every lookup (schema.py is generated, so it lives here)
+PROVIDER_KEYS: dict[Provider, str] = {
+    provider: provider.value.lower() for provider in Provider
+}
+
 
 class ProviderAliases:
     """Field alias mappings for each LLM provider"""
@@ -357,8 +367,12 @@ class ProviderAliases:
         return providers
 
     @classmethod
+    @lru_cache(maxsize=None)
     def get_reverse_mapping(cls, provider: str) -> dict[str, str]:
-        """Get reverse mapping (IR -> provider) for a specific provider"""
+        """Get reverse mapping (IR -> provider) for a specific provider
+
+        The mapping is built once per provider and shared; do not mutate it.
+        """
         aliases = cls.get_provider_aliases(provider)
         return {v: k for k, v in aliases.items()}
 
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import json
 import time
-from abc import ABC, abstractmethod
-from typing import Any, TYPE_CHECKING
+from abc import abstractmethod
+from typing import Any, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .schema import (
@@ -15,25 +14,78 @@ if TYPE_CHECKING:
         Message,
         Provider,
     )
-from .aliases import ProviderAliases
+    from .stream_event import StreamEventFast
+from .aliases import PROVIDER_KEYS, ProviderAliases
+from .serialization import canonical_dumps
 
 
-class BaseAdapter(ABC):
+class BaseAdapter:
     """Base class for all provider adapters
 
     Each adapter must implement to_unified() and from_unified() methods
     to convert between provider-specific format and the brand-neutral IR.
+
+    Abstract methods are enforced without ABCMeta: each subclass records the
+    @abstractmethod-marked methods it leaves unimplemented, and instantiating
+    a class with any of them raises TypeError, as ABC would.
     """
 
+    # Names of unimplemented abstract methods, computed per class
+    _abstract_methods: frozenset[str] = frozenset()
+
+    __slots__ = (
+        "provider_name_original",
+        "provider_name",
+        "_aliases",
+        "_reverse_aliases",
+        "_stream_sequence_id",
+        "_stream_start_ns",
+        "_stream_last_ns",
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._abstract_methods = _collect_abstract_methods(cls)
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> BaseAdapter:
+        # Checked here rather than in __init__ so subclasses that skip
+        # super().__init__() are still rejected, as with ABC
+        if cls._abstract_methods:
+            raise TypeError(
+                f"Can't instantiate abstract class {cls.__name__} "
+                f"with abstract methods {', '.join(sorted(cls._abstract_methods))}"
+            )
+        return super().__new__(cls)
+
     def __init__(self, provider_name: Provider) -> None:
         self.provider_name_original = provider_name
-        self.provider_name = provider_name.value.lower()
-        self.aliases = ProviderAliases.get_provider_aliases(self.provider_name)
-        self.reverse_aliases = ProviderAliases.get_reverse_mapping(self.provider_name)
+        self.provider_name = PROVIDER_KEYS[provider_name]
+        # Alias mappings are looked up on first use
+        self._aliases: dict[str, str] | None = None
+        self._reverse_aliases: dict[str, str] | None = None
 
         # Streaming state management (aligned with LiteLLM design)
         self._stream_sequence_id = 0
-        self._stream_start_time: float | None = None
+        # time.monotonic_ns() of the first event; 0 until the stream starts
+        self._stream_start_ns = 0
+        # Clock value assigned to the latest event, kept strictly increasing
+        self._stream_last_ns = 0
+
+    @property
+    def aliases(self) -> dict[str, str]:
+        """Provider field -> IR field mapping, looked up on first use"""
+        if self._aliases is None:
+            self._aliases = ProviderAliases.get_provider_aliases(self.provider_name)
+        return self._aliases
+
+    @property
+    def reverse_aliases(self) -> dict[str, str]:
+        """IR field -> provider field mapping, looked up on first use"""
+        if self._reverse_aliases is None:
+            self._reverse_aliases = ProviderAliases.get_reverse_mapping(
+                self.provider_name
+            )
+        return self._reverse_aliases
 
     @abstractmethod
     def to_unified_request(self, data: dict[str, Any]) -> CoreRequest:
@@ -87,9 +139,12 @@ class BaseAdapter(ABC):
         sequence_id and timestamp counters.
         """
         self._stream_sequence_id = 0
-        self._stream_start_time = None
+        self._stream_start_ns = 0
+        self._stream_last_ns = 0
 
-    def to_unified_stream_event(self, data: dict[str, Any]) -> StreamEvent:
+    def to_unified_stream_event(
+        self, data: dict[str, Any]
+    ) -> StreamEvent | StreamEventFast:
         """Convert provider-specific stream event to unified IR format.
 
         Automatically manages sequence_id and timestamp internally,
@@ -99,7 +154,9 @@ class BaseAdapter(ABC):
             data: Provider-specific stream event data
 
         Returns:
-            Unified StreamEvent
+            Unified StreamEvent, or an unvalidated StreamEventFast for
+            adapters that build those; call to_pydantic() on it where a
+            StreamEvent is required
 
         Example:
             # Simple usage - automatic state management
@@ -110,17 +167,68 @@ class BaseAdapter(ABC):
         sequence_id = self._stream_sequence_id
         self._stream_sequence_id += 1
 
-        # Auto-generate timestamp
-        if self._stream_start_time is None:
-            self._stream_start_time = time.time()
-        timestamp = time.time() - self._stream_start_time
+        # Auto-generate timestamp (seconds since the first event) from a
+        # single monotonic clock read, nudged forward by 1ns if the clock
+        # has not advanced so timestamps are strictly increasing
+        now = time.monotonic_ns()
+        if now <= self._stream_last_ns:
+            now = self._stream_last_ns + 1
+        self._stream_last_ns = now
+        if not self._stream_start_ns:
+            self._stream_start_ns = now
+        timestamp = (now - self._stream_start_ns) * 1e-9
 
         # Call implementation method (subclasses should override _to_unified_stream_event_impl)
         return self._to_unified_stream_event_impl(data, sequence_id, timestamp)
 
+    def to_unified_stream_events(
+        self, events: Sequence[dict[str, Any]]
+    ) -> list[StreamEvent | StreamEventFast]:
+        """Convert a batch of provider-specific stream events to unified IR.
+
+        Equivalent to calling to_unified_stream_event() per event, but the
+        clock is read once per batch: event i is stamped i nanoseconds after
+        that read, so timestamps stay strictly increasing within the batch
+        and across batch and single-event calls.
+
+        Args:
+            events: Provider-specific stream events, in stream order
+
+        Returns:
+            Unified StreamEvents, one per input event
+        """
+        first_sequence_id, offset_ns = self._reserve_stream_batch(len(events))
+        impl = self._to_unified_stream_event_impl
+        return [
+            impl(data, first_sequence_id + i, (offset_ns + i) * 1e-9)
+            for i, data in enumerate(events)
+        ]
+
+    def _reserve_stream_batch(self, count: int) -> tuple[int, int]:
+        """Reserve sequence ids for a batch and read the clock once
+
+        Args:
+            count: Number of events in the batch
+
+        Returns:
+            Tuple of (first sequence_id, nanoseconds since stream start);
+            event i of the batch gets both values plus i
+        """
+        now = time.monotonic_ns()
+        if now <= self._stream_last_ns:
+            now = self._stream_last_ns + 1
+        if count:
+            self._stream_last_ns = now + count - 1
+        if not self._stream_start_ns:
+            self._stream_start_ns = now
+
+        first_sequence_id = self._stream_sequence_id
+        self._stream_sequence_id += count
+        return first_sequence_id, now - self._stream_start_ns
+
     def _to_unified_stream_event_impl(
         self, data: dict[str, Any], sequence_id: int, timestamp: float
-    ) -> StreamEvent:
+    ) -> StreamEvent | StreamEventFast:
         """Internal implementation for stream event conversion.
 
         Subclasses should override this method instead of to_unified_stream_event()
@@ -148,21 +256,32 @@ class BaseAdapter(ABC):
             metadata=data.get("metadata"),
         )
 
-    def from_unified_stream_event(self, unified_event: StreamEvent) -> dict[str, Any]:
-        """Convert unified IR stream event to provider-specific format"""
+    def from_unified_stream_event(
+        self, unified_event: StreamEvent | StreamEventFast
+    ) -> dict[str, Any]:
+        """Convert unified IR stream event to provider-specific format
+
+        Fields that are None are left out, except type and sequence_id, so
+        subclasses that want sparse output need not override this.
+        """
         # Default implementation - subclasses should override if needed
-        return {
+        result = {
             "type": unified_event.type,
             "sequence_id": unified_event.sequence_id,
-            "timestamp": unified_event.timestamp,
-            "content_delta": unified_event.content_delta,
-            "tool_call_delta": unified_event.tool_call_delta,
-            "tool_call": unified_event.tool_call,
-            "finish_reason": unified_event.finish_reason,
-            "content_index": unified_event.content_index,
-            "error": unified_event.error,
-            "metadata": unified_event.metadata,
         }
+        for key, value in (
+            ("timestamp", unified_event.timestamp),
+            ("content_delta", unified_event.content_delta),
+            ("tool_call_delta", unified_event.tool_call_delta),
+            ("tool_call", unified_event.tool_call),
+            ("finish_reason", unified_event.finish_reason),
+            ("content_index", unified_event.content_index),
+            ("error", unified_event.error),
+            ("metadata", unified_event.metadata),
+        ):
+            if value is not None:
+                result[key] = value
+        return result
 
     def map_field_to_unified(self, field_name: str) -> str:
         """Map provider field name to unified field name"""
@@ -203,11 +322,14 @@ class BaseAdapter(ABC):
 
     def _deep_compare(self, obj1: Any, obj2: Any, path: str = "") -> bool:
         """Deep comparison of two objects, ignoring ordering of lists"""
+        if obj1 is obj2:
+            return True
+
         if type(obj1) != type(obj2):
             return False
 
         if isinstance(obj1, dict):
-            if set(obj1.keys()) != set(obj2.keys()):
+            if len(obj1) != len(obj2) or obj1.keys() != obj2.keys():
                 return False
             return all(
                 self._deep_compare(obj1[k], obj2[k], f"{path}.{k}") for k in obj1.keys()
@@ -217,34 +339,28 @@ class BaseAdapter(ABC):
             if len(obj1) != len(obj2):
                 return False
             # For lists, we compare as multisets (order-independent)
-            # Create a list of serialized forms for sorting
-            obj1_serialized = []
-            obj2_serialized = []
-            for item1, item2 in zip(obj1, obj2):
-                # For dict items, we need to serialize consistently
-                if isinstance(item1, dict) and isinstance(item2, dict):
-                    # Sort keys and serialize consistently
-                    sorted_keys = sorted(set(item1.keys()) | set(item2.keys()))
-                    serialized1 = json.dumps(
-                        {k: item1.get(k) for k in sorted_keys}, sort_keys=True
-                    )
-                    serialized2 = json.dumps(
-                        {k: item2.get(k) for k in sorted_keys}, sort_keys=True
-                    )
-                    obj1_serialized.append(serialized1)
-                    obj2_serialized.append(serialized2)
-                else:
-                    # For non-dict items, use string representation
-                    obj1_serialized.append(json.dumps(item1, sort_keys=True))
-                    obj2_serialized.append(json.dumps(item2, sort_keys=True))
-            return sorted(obj1_serialized) == sorted(obj2_serialized)
+            return canonical_dumps(obj1) == canonical_dumps(obj2)
 
         return obj1 == obj2
 
 
+def _collect_abstract_methods(cls: type) -> frozenset[str]:
+    """Find @abstractmethod-marked attributes a class does not implement"""
+    return frozenset(
+        name
+        for name in dir(cls)
+        if getattr(getattr(cls, name, None), "__isabstractmethod__", False)
+    )
+
+
+BaseAdapter._abstract_methods = _collect_abstract_methods(BaseAdapter)
+
+
 class RequestAdapter(BaseAdapter):
     """Adapter specialized for request conversion"""
 
+    __slots__ = ()
+
     @abstractmethod
     def to_unified_request(self, data: dict[str, Any]) -> CoreRequest:
         """Convert provider request to unified IR"""
@@ -259,6 +375,8 @@ class RequestAdapter(BaseAdapter):
 class ResponseAdapter(BaseAdapter):
     """Adapter specialized for response conversion"""
 
+    __slots__ = ()
+
     @abstractmethod
     def to_unified_response(self, data: dict[str, Any]) -> CoreResponse:
         """Convert provider response to unified IR"""
@@ -273,12 +391,18 @@ class ResponseAdapter(BaseAdapter):
 class StreamAdapter(BaseAdapter):
     """Adapter specialized for streaming event conversion"""
 
+    __slots__ = ()
+
     @abstractmethod
-    def to_unified_stream_event(self, data: dict[str, Any]) -> StreamEvent:
+    def to_unified_stream_event(
+        self, data: dict[str, Any]
+    ) -> StreamEvent | StreamEventFast:
         """Convert provider stream event to unified IR"""
         pass
 
     @abstractmethod
-    def from_unified_stream_event(self, unified_event: StreamEvent) -> dict[str, Any]:
+    def from_unified_stream_event(
+        self, unified_event: StreamEvent | StreamEventFast
+    ) -> dict[str, Any]:
         """Convert unified IR stream event to provider format"""
         pass
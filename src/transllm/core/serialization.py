@@ -0,0 +1,192 @@
+"""JSON helpers shared by adapters and converters
+
+orjson is used when it is installed and the standard library json module
+otherwise, so it stays an optional dependency.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def json_loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Parse a JSON document from bytes or str
+
+    Args:
+        data: Raw JSON payload
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def sorted_dumps(obj: Any) -> bytes:
+    """Serialize a plain JSON object to JSON bytes with sorted dict keys
+
+    Unlike canonical_dumps(), list order is preserved, so the result can
+    serve as an exact cache key for a payload. Only plain JSON is accepted
+    (dicts with str keys, lists, str, int, float, bool and None, with no
+    subclasses such as enums), so distinct payloads never share a key;
+    non-finite floats are written as NaN/Infinity/-Infinity, not null.
+
+    Args:
+        obj: Plain JSON object
+
+    Returns:
+        JSON bytes
+
+    Raises:
+        TypeError: If obj is not plain JSON
+    """
+    if _check_plain_json(obj) or orjson is None:
+        # orjson would write non-finite floats as null
+        return json.dumps(
+            obj, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        # e.g. integers outside the 64-bit range
+        return json.dumps(
+            obj, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+
+
+def _check_plain_json(obj: Any) -> bool:
+    """Check that an object is plain JSON
+
+    Returns:
+        True if obj contains non-finite floats
+
+    Raises:
+        TypeError: If obj contains anything but dicts with str keys, lists,
+            str, int, float, bool and None (subclasses excluded)
+    """
+    obj_type = type(obj)
+    if obj_type in _PLAIN_JSON_SCALARS:
+        return False
+    if obj_type in _PLAIN_JSON_FLOAT:
+        return not math.isfinite(obj)
+
+    non_finite = False
+    if obj_type in _PLAIN_JSON_DICT:
+        for key, value in obj.items():
+            if type(key) not in _PLAIN_JSON_STR:
+                raise TypeError(f"dict key {key!r} is not a str")
+            non_finite = _check_plain_json(value) or non_finite
+        return non_finite
+    if obj_type in _PLAIN_JSON_LIST:
+        for item in obj:
+            non_finite = _check_plain_json(item) or non_finite
+        return non_finite
+    raise TypeError(f"{obj_type.__name__} is not a plain JSON type")
+
+
+# Exact types accepted by _check_plain_json(), as sets for type() lookups
+_PLAIN_JSON_SCALARS = frozenset({str, int, bool, type(None)})
+_PLAIN_JSON_FLOAT = frozenset({float})
+_PLAIN_JSON_STR = frozenset({str})
+_PLAIN_JSON_DICT = frozenset({dict})
+_PLAIN_JSON_LIST = frozenset({list})
+
+
+def canonical_dumps(obj: Any) -> bytes:
+    """Serialize an object to canonical JSON bytes for equality checks
+
+    Dict keys are sorted, enums are replaced by their values and list items
+    are sorted by their own canonical form, so lists compare as multisets.
+    Each subtree is serialized once, bottom-up, and leaves that are not
+    JSON-serializable fall back to str().
+
+    Distinct values never share a form: non-finite floats are written as
+    NaN/Infinity/-Infinity rather than null, and non-str dict keys are
+    written unquoted (e.g. {1: "x"} as {1:"x"}, not {"1":"x"}). The result
+    is therefore not always valid JSON.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        Canonical JSON bytes; equal for equivalent objects
+    """
+    if isinstance(obj, Enum):
+        obj = obj.value
+
+    if isinstance(obj, dict):
+        items = sorted(
+            (_canonical_key(key), canonical_dumps(value)) for key, value in obj.items()
+        )
+        return b"{" + b",".join(key + b":" + value for key, value in items) + b"}"
+
+    if isinstance(obj, (list, tuple)):
+        numeric = _homogeneous_numeric_type(obj)
+        if numeric is not None:
+            # Token ids, logprobs, embeddings: sort natively, dump in one call
+            return _dumps_leaf(sorted(obj))
+        return b"[" + b",".join(sorted(canonical_dumps(item) for item in obj)) + b"]"
+
+    return _dumps_leaf(obj)
+
+
+def _homogeneous_numeric_type(items: list | tuple) -> type | None:
+    """Return int or float if every item has exactly that type, else None
+
+    Mixed int/float lists are excluded because 1 and 1.0 sort as equal but
+    serialize differently. For the same reason float lists containing zeros
+    are excluded (0.0 and -0.0 sort as equal), as are float lists containing
+    NaN or infinities, since NaN has no sort order and orjson writes both as
+    null.
+    """
+    if not items:
+        return None
+    types = set(map(type, items))
+    if types == {int}:
+        return int
+    if types == {float} and 0.0 not in items and all(map(math.isfinite, items)):
+        return float
+    return None
+
+
+def _canonical_key(key: Any) -> bytes:
+    """Serialize a dict key so that str and non-str keys never collide
+
+    str keys are JSON strings; any other key uses its canonical form, which
+    is never a JSON string.
+    """
+    if isinstance(key, Enum):
+        key = key.value
+    if isinstance(key, str):
+        return _dumps_leaf(key)
+    encoded = canonical_dumps(key)
+    # str() fallback of an unserializable key: tag it so it differs from "..."
+    return b"!" + encoded if encoded[:1] == b'"' else encoded
+
+
+def _dumps_leaf(value: Any) -> bytes:
+    """Serialize a scalar value to JSON bytes
+
+    Non-finite floats use the stdlib json spelling (NaN, Infinity,
+    -Infinity), since orjson would write them as null.
+    """
+    if isinstance(value, float) and not math.isfinite(value):
+        return json.dumps(value).encode()
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=str)
+        except TypeError:
+            # e.g. integers outside the 64-bit range
+            pass
+    return json.dumps(value, default=str, ensure_ascii=False).encode()
@@ -0,0 +1,222 @@
+"""Lightweight stream event container for the streaming hot path
+
+StreamEvent (core/schema.py) is a generated Pydantic model, and validating
+one per streamed chunk is redundant when the adapter building it already
+produces well-typed values. StreamEventFast carries the same fields in a
+slotted dataclass without validation; call to_pydantic() where a validated
+StreamEvent is needed, e.g. at an external API boundary.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, TypedDict
+
+from .schema import Error, StreamEvent, StreamEventType, ToolCall, ToolCallDelta
+
+# Integer tags for StreamEventType, so hot-path filters can compare ints
+# instead of going through event.type.value
+TAG_CONTENT_DELTA = 0
+TAG_TOOL_CALL_DELTA = 1
+TAG_CONTENT_FINISH = 2
+TAG_STREAM_END = 3
+TAG_ERROR = 4
+TAG_METADATA_UPDATE = 5
+
+_TYPE_TAGS: dict[StreamEventType, int] = {
+    StreamEventType.content_delta: TAG_CONTENT_DELTA,
+    StreamEventType.tool_call_delta: TAG_TOOL_CALL_DELTA,
+    StreamEventType.content_finish: TAG_CONTENT_FINISH,
+    StreamEventType.stream_end: TAG_STREAM_END,
+    StreamEventType.error: TAG_ERROR,
+    StreamEventType.metadata_update: TAG_METADATA_UPDATE,
+}
+_TAG_TYPES: dict[int, StreamEventType] = {tag: t for t, tag in _TYPE_TAGS.items()}
+
+
+class ToolCallDeltaFields(TypedDict, total=False):
+    """Keys of a ToolCallDelta stored as a plain dict"""
+
+    name: str | None
+    arguments_delta: str | None
+    identifier: str | None
+
+
+class ToolCallDeltaDict(dict):
+    """Dict-backed tool call delta with ToolCallDelta attribute access
+
+    Tool call argument deltas can arrive hundreds of times per response,
+    so adapters build this dict instead of a nested Pydantic model.
+    Attribute reads mirror ToolCallDelta: the ToolCallDeltaFields keys read
+    as None when unset, and any other name raises AttributeError.
+    to_pydantic() validates it into a ToolCallDelta like any mapping.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in _TOOL_CALL_DELTA_FIELDS:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        return self.get(name)
+
+
+_TOOL_CALL_DELTA_FIELDS = frozenset(ToolCallDeltaFields.__annotations__)
+
+
+@dataclass(slots=True)
+class StreamEventFast:
+    """Unvalidated, slotted counterpart of StreamEvent
+
+    Field names and types match StreamEvent, so code reading either works
+    unchanged. Callers must pass already-typed values: a StreamEventType
+    member for type and a ToolCallDelta or ToolCallDeltaDict for
+    tool_call_delta.
+
+    type_tag is derived from type at construction (one of the TAG_*
+    constants) and is not part of equality or repr.
+    """
+
+    type: StreamEventType
+    sequence_id: int
+    timestamp: float
+    content_delta: str | None = None
+    tool_call_delta: ToolCallDelta | ToolCallDeltaDict | None = None
+    tool_call: list[ToolCall] | None = None
+    finish_reason: str | None = None
+    content_index: int | None = None
+    error: Error | None = None
+    metadata: dict[str, Any] | None = None
+    type_tag: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.type_tag = _TYPE_TAGS[self.type]
+
+    def to_pydantic(self) -> StreamEvent:
+        """Convert to a validated StreamEvent
+
+        Returns:
+            StreamEvent with the same field values
+        """
+        return StreamEvent(
+            type=self.type,
+            sequence_id=self.sequence_id,
+            timestamp=self.timestamp,
+            content_delta=self.content_delta,
+            tool_call_delta=self.tool_call_delta,
+            tool_call=self.tool_call,
+            finish_reason=self.finish_reason,
+            content_index=self.content_index,
+            error=self.error,
+            metadata=self.metadata,
+        )
+
+
+class StreamEventBuffer:
+    """Column-oriented (structure-of-arrays) store for a stream of events
+
+    Type tags, sequence ids and timestamps live in compact stdlib arrays
+    and the remaining fields in one list per field, so filters such as
+    "all content deltas" scan one byte per event instead of visiting every
+    event object. Indexing returns a StreamEventFast row built on demand.
+
+    Example:
+        buffer = StreamEventBuffer(adapter.to_unified_stream_events(events))
+        text = "".join(
+            buffer.content_deltas[i] for i in buffer.filter_type(TAG_CONTENT_DELTA)
+        )
+    """
+
+    __slots__ = (
+        "type_tags",
+        "sequence_ids",
+        "timestamps",
+        "content_deltas",
+        "tool_call_deltas",
+        "tool_calls",
+        "finish_reasons",
+        "content_indexes",
+        "errors",
+        "metadata",
+    )
+
+    def __init__(self, events: Iterable[StreamEvent | StreamEventFast] = ()) -> None:
+        self.type_tags = bytearray()
+        self.sequence_ids = array("q")
+        self.timestamps = array("d")
+        self.content_deltas: list[str | None] = []
+        self.tool_call_deltas: list[ToolCallDelta | ToolCallDeltaDict | None] = []
+        self.tool_calls: list[list[ToolCall] | None] = []
+        self.finish_reasons: list[str | None] = []
+        self.content_indexes: list[int | None] = []
+        self.errors: list[Error | None] = []
+        self.metadata: list[dict[str, Any] | None] = []
+        self.extend(events)
+
+    def append(self, event: StreamEvent | StreamEventFast) -> None:
+        """Append one event, splitting its fields into the columns
+
+        Args:
+            event: StreamEvent or StreamEventFast to store
+        """
+        self.type_tags.append(_TYPE_TAGS[event.type])
+        self.sequence_ids.append(event.sequence_id)
+        self.timestamps.append(event.timestamp)
+        self.content_deltas.append(event.content_delta)
+        self.tool_call_deltas.append(event.tool_call_delta)
+        self.tool_calls.append(event.tool_call)
+        self.finish_reasons.append(event.finish_reason)
+        self.content_indexes.append(event.content_index)
+        self.errors.append(event.error)
+        self.metadata.append(event.metadata)
+
+    def extend(self, events: Iterable[StreamEvent | StreamEventFast]) -> None:
+        """Append events in order
+
+        Args:
+            events: Events to store
+        """
+        append = self.append
+        for event in events:
+            append(event)
+
+    def filter_type(self, tag: int) -> list[int]:
+        """Find the positions of all events with a given type tag
+
+        Args:
+            tag: One of the TAG_* constants
+
+        Returns:
+            Indexes of matching events, in stream order
+        """
+        # bytearray.find scans the tag column in C; Python only runs per match
+        find = self.type_tags.find
+        indexes = []
+        index = find(tag)
+        while index != -1:
+            indexes.append(index)
+            index = find(tag, index + 1)
+        return indexes
+
+    def __len__(self) -> int:
+        return len(self.type_tags)
+
+    def __getitem__(self, index: int) -> StreamEventFast:
+        return StreamEventFast(
+            type=_TAG_TYPES[self.type_tags[index]],
+            sequence_id=self.sequence_ids[index],
+            timestamp=self.timestamps[index],
+            content_delta=self.content_deltas[index],
+            tool_call_delta=self.tool_call_deltas[index],
+            tool_call=self.tool_calls[index],
+            finish_reason=self.finish_reasons[index],
+            content_index=self.content_indexes[index],
+            error=self.errors[index],
+            metadata=self.metadata[index],
+        )
+
+    def __iter__(self) -> Iterator[StreamEventFast]:
+        for index in range(len(self)):
+            yield self[index]
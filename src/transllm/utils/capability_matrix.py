@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+from ..core.aliases import PROVIDER_KEYS
 from ..core.schema import Provider
 
 
@@ -73,7 +74,7 @@ class ProviderCapabilityMatrix:
     def get_capabilities(cls, provider: Provider) -> ProviderCapabilities:
         """Get capabilities for a provider"""
         # Convert enum to string for lookup
-        provider_key = provider.value.lower()
+        provider_key = PROVIDER_KEYS[provider]
 
         if provider_key not in cls._capabilities:
             # Return default capabilities if not registered
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Type
+import importlib
+import threading
+from functools import lru_cache
+from typing import Any, Type
 
 from src.transllm.core.schema import Provider
+from ..core.aliases import PROVIDER_KEYS
 from ..core.base_adapter import BaseAdapter
 from ..core.exceptions import UnsupportedProviderError
 
@@ -13,6 +17,8 @@ class ProviderRegistry:
     """Central registry for all provider adapters"""
 
     _adapters: dict[str, Type[BaseAdapter]] = {}
+    # Adapters registered by import path, resolved on first use
+    _lazy_adapters: dict[str, str] = {}
 
     @classmethod
     def register(
@@ -24,37 +30,95 @@ class ProviderRegistry:
             provider_name: Provider enum
             adapter_class: Adapter class for this provider
         """
-        if not issubclass(adapter_class, BaseAdapter):
-            raise TypeError(
-                f"Adapter must be a subclass of BaseAdapter, got {adapter_class}"
-            )
+        _check_adapter_class(adapter_class)
 
-        provider_key = provider_name.value.lower()
+        provider_key = PROVIDER_KEYS[provider_name]
+        cls._lazy_adapters.pop(provider_key, None)
         cls._adapters[provider_key] = adapter_class
+        _clear_lookup_caches()
 
     @classmethod
-    def get_adapter(cls, provider_name: Provider) -> BaseAdapter:
-        """Get an instance of the adapter for a provider
+    def register_lazy(cls, provider_name: Provider, adapter_path: str) -> None:
+        """Register a provider adapter by import path without importing it
+
+        The module is imported and the class registered the first time the
+        provider's adapter is requested, keeping package import cheap.
+
+        Args:
+            provider_name: Provider enum
+            adapter_path: Adapter location as "package.module:ClassName"
+        """
+        provider_key = PROVIDER_KEYS[provider_name]
+        cls._adapters.pop(provider_key, None)
+        cls._lazy_adapters[provider_key] = adapter_path
+        _clear_lookup_caches()
+
+    @classmethod
+    def get_adapter_class(cls, provider_name: Provider) -> Type[BaseAdapter]:
+        """Get the adapter class registered for a provider
 
         Args:
             provider_name: Provider enum
 
         Returns:
-            An instance of the provider's adapter
+            The provider's adapter class
 
         Raises:
             UnsupportedProviderError: If provider is not registered
         """
-        provider_key = provider_name.value.lower()
-
-        if provider_key not in cls._adapters:
+        try:
+            return _adapter_class_for(PROVIDER_KEYS[provider_name])
+        except KeyError:
             raise UnsupportedProviderError(
                 provider_name,
                 cls.list_supported_providers(),
-            )
+            ) from None
+
+    @classmethod
+    def get_adapter(cls, provider_name: Provider) -> BaseAdapter:
+        """Get a new instance of the adapter for a provider
+
+        Each call returns a fresh adapter with its own stream state.
+
+        Args:
+            provider_name: Provider enum
+
+        Returns:
+            An instance of the provider's adapter
+
+        Raises:
+            UnsupportedProviderError: If provider is not registered
+        """
+        return cls.get_adapter_class(provider_name)(provider_name)
+
+    @classmethod
+    def get_shared_adapter(cls, provider_name: Provider) -> BaseAdapter:
+        """Get a per-thread adapter for request/response conversion
+
+        The instance is created once per provider and thread and reused by
+        RequestConverter and ResponseConverter, which never touch stream
+        state. Its stream state is not reset, so it must not be used for
+        streaming; use get_adapter() for that.
+
+        Args:
+            provider_name: Provider enum
+
+        Returns:
+            The calling thread's shared instance of the provider's adapter
+
+        Raises:
+            UnsupportedProviderError: If provider is not registered
+        """
+        adapters = getattr(_thread_adapters, "adapters", None)
+        if adapters is None or _thread_adapters.generation != _registry_generation:
+            adapters = _thread_adapters.adapters = {}
+            _thread_adapters.generation = _registry_generation
 
-        adapter_class = cls._adapters[provider_key]
-        return adapter_class(provider_name)
+        provider_key = PROVIDER_KEYS[provider_name]
+        adapter = adapters.get(provider_key)
+        if adapter is None:
+            adapter = adapters[provider_key] = cls.get_adapter(provider_name)
+        return adapter
 
     @classmethod
     def list_supported_providers(cls) -> list[str]:
@@ -63,7 +127,7 @@ class ProviderRegistry:
         Returns:
             List of provider names
         """
-        return list(cls._adapters.keys())
+        return [*cls._adapters, *cls._lazy_adapters]
 
     @classmethod
     def is_supported(cls, provider_name: Provider) -> bool:
@@ -75,7 +139,7 @@ class ProviderRegistry:
         Returns:
             True if provider is supported, False otherwise
         """
-        return provider_name.value.lower() in cls._adapters
+        return _is_supported_key(PROVIDER_KEYS[provider_name])
 
     @classmethod
     def unregister(cls, provider_name: Provider) -> None:
@@ -84,14 +148,77 @@ class ProviderRegistry:
         Args:
             provider_name: Provider enum to unregister
         """
-        provider_key = provider_name.value.lower()
-        if provider_key in cls._adapters:
-            del cls._adapters[provider_key]
+        provider_key = PROVIDER_KEYS[provider_name]
+        cls._adapters.pop(provider_key, None)
+        cls._lazy_adapters.pop(provider_key, None)
+        _clear_lookup_caches()
 
     @classmethod
     def clear(cls) -> None:
         """Clear all registered adapters"""
         cls._adapters.clear()
+        cls._lazy_adapters.clear()
+        _clear_lookup_caches()
+
+
+# Registry lookups run once per stream event; both caches are invalidated
+# whenever the registry changes
+@lru_cache(maxsize=None)
+def _adapter_class_for(provider_key: str) -> Type[BaseAdapter]:
+    """Resolve the adapter class for a provider key, importing lazy entries
+
+    Raises:
+        KeyError: If no adapter is registered for the key
+    """
+    adapter_class = ProviderRegistry._adapters.get(provider_key)
+    if adapter_class is not None:
+        return adapter_class
+
+    adapter_path = ProviderRegistry._lazy_adapters[provider_key]
+    module_name, _, class_name = adapter_path.partition(":")
+    adapter_class = getattr(importlib.import_module(module_name), class_name)
+    _check_adapter_class(adapter_class)
+    return adapter_class
+
+
+@lru_cache(maxsize=None)
+def _is_supported_key(provider_key: str) -> bool:
+    """Check if an adapter is registered for a provider key"""
+    return (
+        provider_key in ProviderRegistry._adapters
+        or provider_key in ProviderRegistry._lazy_adapters
+    )
+
+
+def _check_adapter_class(adapter_class: Any) -> None:
+    """Check that a class implements the adapter interface
+
+    This is a duck-type check rather than issubclass(), so adapters need
+    not inherit from BaseAdapter and registration avoids subclass checks.
+
+    Raises:
+        TypeError: If adapter_class is not an adapter class
+    """
+    if not isinstance(adapter_class, type) or not callable(
+        getattr(adapter_class, "to_unified_stream_event", None)
+    ):
+        raise TypeError(
+            f"Adapter must implement the BaseAdapter interface, got {adapter_class}"
+        )
+
+
+# Per-thread adapter instances handed out by get_shared_adapter(), discarded
+# when their generation no longer matches the registry's
+_thread_adapters = threading.local()
+_registry_generation = 0
+
+
+def _clear_lookup_caches() -> None:
+    """Invalidate cached registry lookups after a registry change"""
+    global _registry_generation
+    _adapter_class_for.cache_clear()
+    _is_supported_key.cache_clear()
+    _registry_generation += 1
 
 
 # Convenience functions
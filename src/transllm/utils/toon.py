@@ -0,0 +1,215 @@
+"""TOON (Token-Oriented Object Notation) encoding for tool results
+
+JSON repeats every field name on every row of an array of objects. TOON
+writes uniform arrays as a table with a single header instead:
+
+    [2]{id,name}:
+      1,Alice
+      2,Bob
+
+Only uniform arrays of flat objects are encoded; nested or non-uniform data
+stays JSON, where TOON has no token advantage.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+_NUMBER_LIKE_RE = re.compile(r"^-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?$")
+_NEEDS_QUOTING_RE = re.compile(r'[,:"\\\[\]{}#\x00-\x1f]')
+
+
+def is_uniform_table(value: Any) -> bool:
+    """Check if a value is a non-empty list of flat dicts sharing the same keys
+
+    Args:
+        value: Value to check
+
+    Returns:
+        True if the value can be encoded as a TOON table
+    """
+    if not isinstance(value, list) or not value:
+        return False
+
+    first = value[0]
+    if not isinstance(first, dict) or not first:
+        return False
+
+    keys = first.keys()
+    for row in value:
+        if not isinstance(row, dict) or row.keys() != keys:
+            return False
+        for cell in row.values():
+            if not isinstance(cell, _PRIMITIVE_TYPES):
+                return False
+    return True
+
+
+def encode_table(rows: list[dict[str, Any]]) -> str:
+    """Encode a uniform list of dicts as a TOON table
+
+    Args:
+        rows: Rows accepted by is_uniform_table()
+
+    Returns:
+        TOON document string
+    """
+    fields = list(rows[0])
+    lines = [f"[{len(rows)}]{{{','.join(_encode_string(f) for f in fields)}}}:"]
+    for row in rows:
+        lines.append("  " + ",".join(_encode_primitive(row[f]) for f in fields))
+    return "\n".join(lines)
+
+
+def encode_tool_result(value: Any) -> Any:
+    """Re-encode a tool result payload as TOON where it is a uniform table
+
+    Handles the shapes tool results take in converted payloads: a list of
+    rows, a JSON string holding a list of rows, or a dict whose top-level
+    values are either of those. Lists of content blocks (dicts with a
+    "type" key, e.g. {"type": "text", "text": ...}) are message content,
+    not data, and are never encoded. Anything else is returned unchanged,
+    and input containers are never mutated.
+
+    Args:
+        value: Tool result payload
+
+    Returns:
+        TOON string, a shallow-copied dict with encoded values, or value
+    """
+    if isinstance(value, list):
+        if _is_content_blocks(value) or not is_uniform_table(value):
+            return value
+        return encode_table(value)
+
+    if isinstance(value, str):
+        stripped = value.lstrip()
+        if not stripped.startswith("["):
+            return value
+        try:
+            decoded = json.loads(value)
+        except ValueError:
+            return value
+        if _is_content_blocks(decoded) or not is_uniform_table(decoded):
+            return value
+        return encode_table(decoded)
+
+    if isinstance(value, dict):
+        encoded = None
+        for key, item in value.items():
+            if isinstance(item, (list, str)):
+                new_item = encode_tool_result(item)
+                if new_item is not item:
+                    if encoded is None:
+                        encoded = dict(value)
+                    encoded[key] = new_item
+        return value if encoded is None else encoded
+
+    return value
+
+
+def encode_tool_results(payload: dict[str, Any]) -> dict[str, Any]:
+    """Re-encode uniform tool results in a converted request payload as TOON
+
+    Looks at the places each supported provider carries tool output:
+    OpenAI "tool" role messages and IR-style tool_result blocks, Anthropic
+    tool_result content blocks, Gemini function_response parts, and the
+    text blocks/parts of "tool" role messages (what an OpenAI tool message
+    becomes after conversion to another provider). Block lists are never
+    replaced; only the text or result inside a block is re-encoded. The
+    message and block dicts of a converted payload are built fresh by the
+    adapters, so they are updated in place.
+
+    Args:
+        payload: Request payload produced by an adapter
+
+    Returns:
+        The same payload
+    """
+    for message in payload.get("messages") or payload.get("contents") or ():
+        if not isinstance(message, dict):
+            continue
+
+        is_tool_message = message.get("role") == "tool"
+        if is_tool_message and isinstance(message.get("content"), (str, dict)):
+            # A list here is content parts, which must stay as they are
+            message["content"] = encode_tool_result(message["content"])
+
+        blocks = message.get("content")
+        if not isinstance(blocks, list):
+            blocks = message.get("parts")
+        if not isinstance(blocks, list):
+            continue
+
+        for block in blocks:
+            if not isinstance(block, dict):
+                continue
+            if block.get("type") == "tool_result":
+                if "content" in block:
+                    # Anthropic tool_result block
+                    block["content"] = encode_tool_result(block["content"])
+                elif isinstance(block.get("tool_result"), dict):
+                    # OpenAI-style tool_result block
+                    block["tool_result"] = _encode_field(block["tool_result"], "result")
+            elif isinstance(block.get("function_response"), dict):
+                # Gemini function_response part
+                block["function_response"] = _encode_field(
+                    block["function_response"], "response"
+                )
+            elif (
+                is_tool_message
+                and block.get("type", "text") == "text"
+                and isinstance(block.get("text"), str)
+            ):
+                # Text block/part of a converted tool message
+                block["text"] = encode_tool_result(block["text"])
+
+    return payload
+
+
+def _is_content_blocks(value: list[Any]) -> bool:
+    """Check if a list holds content blocks rather than data rows"""
+    return all(
+        isinstance(item, dict) and isinstance(item.get("type"), str) for item in value
+    )
+
+
+def _encode_field(container: dict[str, Any], key: str) -> dict[str, Any]:
+    """Encode container[key], returning a copy of container only if it changed"""
+    if key not in container:
+        return container
+    value = container[key]
+    encoded = encode_tool_result(value)
+    if encoded is value:
+        return container
+    return {**container, key: encoded}
+
+
+def _encode_primitive(value: Any) -> str:
+    """Encode a single table cell"""
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, (int, float)):
+        return json.dumps(value)
+    return _encode_string(value)
+
+
+def _encode_string(value: str) -> str:
+    """Encode a string, quoting it only when it would be ambiguous unquoted"""
+    if (
+        not value
+        or value != value.strip()
+        or value in ("true", "false", "null")
+        or value.startswith("-")
+        or _NUMBER_LIKE_RE.match(value)
+        or _NEEDS_QUOTING_RE.search(value)
+    ):
+        return json.dumps(value, ensure_ascii=False)
+    return value
@@ -1,14 +1,6 @@
 """Test fixtures for TransLLM"""
 
-from .openai import (
-    OPENAI_CHAT_REQUEST,
-    OPENAI_CHAT_RESPONSE,
-    OPENAI_TOOL_REQUEST,
-    OPENAI_TOOL_RESPONSE,
-    OPENAI_STREAM_EVENTS,
-    OPENAI_MULTIMODAL_REQUEST,
-    OPENAI_FULL_REQUEST,
-)
+import importlib
 
 __all__ = [
     "OPENAI_CHAT_REQUEST",
@@ -19,3 +11,14 @@ __all__ = [
     "OPENAI_MULTIMODAL_REQUEST",
     "OPENAI_FULL_REQUEST",
 ]
+
+
+def __getattr__(name: str):
+    """Import fixtures on first attribute access (PEP 562)
+
+    Test modules importing tests.fixtures.<provider> no longer load the
+    OpenAI fixtures as a side effect.
+    """
+    if name in __all__:
+        return getattr(importlib.import_module(".openai", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
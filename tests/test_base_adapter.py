@@ -0,0 +1,41 @@
+"""BaseAdapter tests
+
+Tests verify that abstract adapter methods are enforced on instantiation.
+"""
+
+import pytest
+from src.transllm import Provider
+from src.transllm.core.base_adapter import BaseAdapter
+
+
+class _IncompleteAdapter(BaseAdapter):
+    """Adapter that implements none of the abstract methods"""
+
+    __slots__ = ()
+
+
+class _NoSuperInitAdapter(_IncompleteAdapter):
+    """Incomplete adapter whose __init__ skips BaseAdapter.__init__"""
+
+    __slots__ = ()
+
+    def __init__(self, provider_name):
+        pass
+
+
+class TestAbstractMethodEnforcement:
+    """Test that incomplete adapters cannot be instantiated"""
+
+    def test_incomplete_adapter_raises(self):
+        """Test that missing abstract methods raise TypeError"""
+        with pytest.raises(TypeError, match="abstract methods"):
+            _IncompleteAdapter(Provider.openai)
+
+    def test_incomplete_adapter_without_super_init_raises(self):
+        """Test that skipping super().__init__() does not bypass the check"""
+        with pytest.raises(TypeError, match="abstract methods"):
+            _NoSuperInitAdapter(Provider.openai)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,108 @@
+"""Gemini adapter utility tests
+
+Tests verify the helpers in the Gemini adapter's utils module: circular
+reference detection, message merging, streamed base64 encoding and
+thought signature decoding.
+"""
+
+import base64
+import copy
+import os
+
+import pytest
+from src.transllm.adapters.gemini.utils import (
+    _b64encode_chunks,
+    decode_thought_signature,
+    detect_circular_reference,
+    merge_duplicate_messages,
+)
+
+
+class TestDetectCircularReference:
+    """Test circular reference detection"""
+
+    def test_cycles_are_detected(self):
+        """Test self-references through dicts and lists"""
+        data = {"a": {"b": []}}
+        data["a"]["b"].append(data)
+        assert detect_circular_reference(data)
+
+        items = [1, 2]
+        items.append(items)
+        assert detect_circular_reference(items)
+
+    def test_shared_references_are_not_cycles(self):
+        """Test that an object reused in sibling branches is not circular"""
+        shared = {"x": [1, 2]}
+        data = {"a": shared, "b": [shared, shared], "c": {"d": shared}}
+        assert not detect_circular_reference(data)
+        assert not detect_circular_reference("plain")
+
+    def test_max_depth_raises(self):
+        """Test that nesting deeper than max_depth raises ValueError"""
+        data = leaf = {}
+        for _ in range(10):
+            leaf["child"] = {}
+            leaf = leaf["child"]
+
+        assert not detect_circular_reference(data, max_depth=10)
+        with pytest.raises(ValueError):
+            detect_circular_reference(data, max_depth=9)
+
+
+class TestMergeDuplicateMessages:
+    """Test merging of consecutive same-role messages"""
+
+    def test_consecutive_roles_are_merged(self):
+        """Test that parts of consecutive same-role messages are combined"""
+        messages = [
+            {"role": "user", "parts": [{"text": "a"}]},
+            {"role": "user", "parts": [{"text": "b"}]},
+            {"role": "model", "parts": [{"text": "c"}]},
+            {"role": "user", "parts": [{"text": "d"}]},
+            {"role": "user"},
+        ]
+        assert merge_duplicate_messages(messages) == [
+            {"role": "user", "parts": [{"text": "a"}, {"text": "b"}]},
+            {"role": "model", "parts": [{"text": "c"}]},
+            {"role": "user", "parts": [{"text": "d"}]},
+        ]
+
+    def test_input_is_not_mutated(self):
+        """Test that input messages and their parts lists are left unchanged"""
+        messages = [
+            {"role": "user", "parts": [{"text": "a"}]},
+            {"role": "user", "parts": [{"text": "b"}]},
+        ]
+        original = copy.deepcopy(messages)
+        merged = merge_duplicate_messages(messages)
+
+        assert messages == original
+        assert merged[0] is not messages[0]
+        assert merged[0]["parts"] is not messages[0]["parts"]
+
+
+class TestBase64Helpers:
+    """Test streamed base64 encoding and thought signature decoding"""
+
+    def test_chunked_encoding_matches_one_shot(self):
+        """Test that any chunking gives the same result as one b64encode"""
+        data = os.urandom(1000)
+        expected = base64.b64encode(data).decode()
+        for size in (1, 2, 3, 4, 5, 64, 999, 1000, 4096):
+            chunks = [data[i : i + size] for i in range(0, len(data), size)]
+            assert _b64encode_chunks(chunks) == expected
+        assert _b64encode_chunks([]) == ""
+
+    def test_decode_thought_signature(self):
+        """Test tool call signatures decode and other blobs are skipped"""
+        signature = base64.b64encode(b"toolcall:call_123").decode()
+        assert decode_thought_signature(signature) == "call_123"
+
+        assert decode_thought_signature(base64.b64encode(b"opaque").decode()) is None
+        assert decode_thought_signature("dG9vbGNhbGw6Y") is None
+        assert decode_thought_signature("") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -48,6 +48,17 @@ class TestOpenAIResponseIdempotency:
             is_idempotent = converter.check_idempotency(data, Provider.openai)
             assert is_idempotent, f"Failed idempotency test: {name}"
 
+    def test_strict_and_default_comparisons_agree(self):
+        """Test the canonical-bytes default and the strict=True comparison"""
+        lossy = {**OPENAI_CHAT_RESPONSE, "unknown_field": 1}
+        for strict in (False, True):
+            assert ResponseConverter.check_idempotency(
+                OPENAI_CHAT_RESPONSE, Provider.openai, strict=strict
+            )
+            assert not ResponseConverter.check_idempotency(
+                lossy, Provider.openai, strict=strict
+            )
+
 
 class TestOpenAIStreamEventIdempotency:
     """Test OpenAI stream event format conversion idempotency"""
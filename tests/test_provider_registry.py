@@ -0,0 +1,38 @@
+"""ProviderRegistry tests
+
+Tests verify adapter lookup and that adapters handed out by the registry
+keep their own stream state.
+"""
+
+import pytest
+from src.transllm import Provider
+from src.transllm.converters.request_converter import RequestConverter
+from src.transllm.utils.provider_registry import ProviderRegistry
+from tests.fixtures.anthropic import ANTHROPIC_STREAMING_EVENTS
+from tests.fixtures.openai import OPENAI_CHAT_REQUEST
+
+
+class TestProviderRegistryAdapters:
+    """Test adapter instances returned by the registry"""
+
+    def test_get_adapter_returns_fresh_instances(self):
+        """Test that each get_adapter call gets its own adapter"""
+        first = ProviderRegistry.get_adapter(Provider.anthropic)
+        second = ProviderRegistry.get_adapter(Provider.anthropic)
+        assert first is not second
+
+    def test_held_adapter_keeps_sequence_across_request_conversion(self):
+        """Test that request conversion does not reset a held adapter"""
+        adapter = ProviderRegistry.get_adapter(Provider.anthropic)
+        event = ANTHROPIC_STREAMING_EVENTS[2]
+        for _ in range(3):
+            adapter.to_unified_stream_event(event)
+
+        RequestConverter.convert(
+            OPENAI_CHAT_REQUEST, Provider.openai, Provider.anthropic
+        )
+        assert adapter.to_unified_stream_event(event).sequence_id == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,227 @@
+"""StreamConverter tests
+
+Tests verify that stream events are converted between provider formats
+through the StreamConverter, including raw JSON payloads.
+"""
+
+import json
+
+import pytest
+from src.transllm import Provider
+from src.transllm.converters.stream_converter import StreamConverter
+from src.transllm.core.schema import StreamEvent
+from tests.fixtures.anthropic import ANTHROPIC_STREAMING_EVENTS
+from tests.fixtures.openai import OPENAI_STREAM_EVENTS
+
+
+class TestStreamConverterConversion:
+    """Test cross-provider stream event conversion"""
+
+    def setup_method(self):
+        self.converter = StreamConverter()
+
+    def test_openai_to_anthropic_text_delta(self):
+        """Test that an OpenAI content chunk becomes an Anthropic text delta"""
+        event = {
+            "choices": [{"index": 0, "delta": {"content": "Hello"}}],
+        }
+        result = self.converter.convert_stream_event(
+            event, Provider.openai, Provider.anthropic
+        )
+
+        assert result["type"] == "content_block_delta"
+        assert result["delta"] == {"type": "text_delta", "text": "Hello"}
+
+    def test_default_output_omits_none_fields(self):
+        """Test that the default stream output only carries populated fields"""
+        result = self.converter.convert_stream_event(
+            ANTHROPIC_STREAMING_EVENTS[2], Provider.anthropic, Provider.gemini
+        )
+        assert result["sequence_id"] == 0
+        assert result["content_delta"] == "Hello"
+        assert None not in result.values()
+        assert "tool_call" not in result
+
+    def test_raw_json_payloads_match_parsed_dicts(self):
+        """Test that bytes and str payloads convert like parsed dicts"""
+        for event in OPENAI_STREAM_EVENTS:
+            expected = StreamConverter().convert_stream_event(
+                event, Provider.openai, Provider.anthropic
+            )
+            from_bytes = StreamConverter().convert_stream_event(
+                json.dumps(event).encode(), Provider.openai, Provider.anthropic
+            )
+            from_str = StreamConverter().convert_stream_event(
+                json.dumps(event), Provider.openai, Provider.anthropic
+            )
+            assert from_bytes == expected
+            assert from_str == expected
+
+    def test_batch_conversion_matches_per_event(self):
+        """Test that convert_stream_events matches per-event conversion"""
+        per_event = StreamConverter()
+        expected = [
+            per_event.convert_stream_event(event, Provider.anthropic, Provider.openai)
+            for event in ANTHROPIC_STREAMING_EVENTS
+        ]
+        raw = [json.dumps(event) for event in ANTHROPIC_STREAMING_EVENTS]
+        result = self.converter.convert_stream_events(
+            raw, Provider.anthropic, Provider.openai
+        )
+        assert [r["choices"] for r in result] == [e["choices"] for e in expected]
+
+    def test_to_unified_event_returns_stream_event(self):
+        """Test that the public boundary returns validated StreamEvents"""
+        for event in ANTHROPIC_STREAMING_EVENTS:
+            unified = self.converter.to_unified_event(event, Provider.anthropic)
+            assert isinstance(unified, StreamEvent)
+            assert unified.model_dump()["sequence_id"] == unified.sequence_id
+
+    def test_sequence_ids_continue_across_events(self):
+        """Test that the cached adapter keeps stream state between calls"""
+        ids = [
+            self.converter.to_unified_event(event, Provider.anthropic).sequence_id
+            for event in ANTHROPIC_STREAMING_EVENTS
+        ]
+        assert ids == list(range(len(ANTHROPIC_STREAMING_EVENTS)))
+
+    def test_reset_stream_state_restarts_sequence(self):
+        """Test that resetting a provider restarts its sequence ids"""
+        event = ANTHROPIC_STREAMING_EVENTS[2]
+        self.converter.to_unified_event(event, Provider.anthropic)
+        self.converter.to_unified_event(event, Provider.anthropic)
+
+        self.converter.reset_stream_state(Provider.anthropic)
+        unified = self.converter.to_unified_event(event, Provider.anthropic)
+        assert unified.sequence_id == 0
+
+    def test_convert_shares_state_with_to_unified_event(self):
+        """Test that convert_stream_event and to_unified_event share adapters"""
+        event = ANTHROPIC_STREAMING_EVENTS[2]
+        self.converter.convert_stream_event(event, Provider.anthropic, Provider.openai)
+        unified = self.converter.to_unified_event(event, Provider.anthropic)
+        assert unified.sequence_id == 1
+
+        self.converter.reset_stream_state(Provider.anthropic)
+        self.converter.convert_stream_event(event, Provider.anthropic, Provider.openai)
+        unified = self.converter.to_unified_event(event, Provider.anthropic)
+        assert unified.sequence_id == 1
+
+
+class TestStreamConverterIdempotencyCache:
+    """Test memoization of check_idempotency results"""
+
+    def setup_method(self):
+        self.converter = StreamConverter()
+        self.event = ANTHROPIC_STREAMING_EVENTS[2]
+
+    def test_repeated_payload_is_served_from_cache(self):
+        """Test that a repeated payload skips the round trip"""
+        first = self.converter.check_idempotency(self.event, Provider.anthropic)
+
+        def fail(*args):
+            raise AssertionError("round trip should be cached")
+
+        self.converter._check_idempotency_uncached = fail
+        reordered = dict(reversed(list(self.event.items())))
+        assert self.converter.check_idempotency(reordered, Provider.anthropic) == first
+
+    def test_check_does_not_touch_stream_state(self):
+        """Test that hits and misses leave the provider's sequence alone"""
+        self.converter.to_unified_event(self.event, Provider.anthropic)
+        state = self.converter.get_provider_state(Provider.anthropic)
+
+        self.converter.check_idempotency(self.event, Provider.anthropic)
+        self.converter.check_idempotency(self.event, Provider.anthropic)
+        assert self.converter.get_provider_state(Provider.anthropic) == state
+        unified = self.converter.to_unified_event(self.event, Provider.anthropic)
+        assert unified.sequence_id == 1
+
+    def test_reset_stream_state_drops_provider_entries(self):
+        """Test that resetting one provider clears only its cached results"""
+        self.converter.check_idempotency(self.event, Provider.anthropic)
+        self.converter.check_idempotency(
+            {"choices": [{"index": 0, "delta": {"content": "Hi"}}]}, Provider.openai
+        )
+
+        self.converter.reset_stream_state(Provider.anthropic)
+        assert [key[0] for key in self.converter._idempotency_cache] == [
+            Provider.openai
+        ]
+
+    def test_nan_and_none_payloads_do_not_share_a_cache_entry(self):
+        """Test that a cached NaN result is not returned for a None payload"""
+        event = {**self.event, "index": float("nan")}
+        self.converter.check_idempotency(event, Provider.anthropic)
+
+        event = {**self.event, "index": None}
+        expected = StreamConverter().check_idempotency(event, Provider.anthropic)
+        assert self.converter.check_idempotency(event, Provider.anthropic) == expected
+
+    def test_non_plain_json_payloads_are_not_cached(self):
+        """Test that enums and non-str keys skip the cache"""
+        self.converter.check_idempotency(
+            {**self.event, "type": Provider.anthropic}, Provider.anthropic
+        )
+        self.converter.check_idempotency({**self.event, 1: "x"}, Provider.anthropic)
+        assert not self.converter._idempotency_cache
+
+    def test_cache_is_bounded_and_cleared_on_reset(self):
+        """Test FIFO eviction and clearing in reset_all_states()"""
+        self.converter._IDEMPOTENCY_CACHE_SIZE = 2
+        for text in ("a", "b", "c"):
+            event = {**self.event, "delta": {"type": "text_delta", "text": text}}
+            self.converter.check_idempotency(event, Provider.anthropic)
+        assert len(self.converter._idempotency_cache) == 2
+
+        self.converter.reset_all_states()
+        assert not self.converter._idempotency_cache
+
+
+class TestStreamConverterDeepCompare:
+    """Test the structural comparison used by idempotency checks"""
+
+    def test_lists_compare_as_multisets(self):
+        """Test that list order is ignored, including for nested dicts"""
+        a = {"items": [{"x": 1, "y": [1, 2]}, {"x": 2}], "n": 1}
+        b = {"n": 1, "items": [{"x": 2}, {"y": [2, 1], "x": 1}]}
+        assert StreamConverter._deep_compare(a, b)
+
+    def test_differences_are_detected(self):
+        """Test that value, type and multiplicity differences are not equal"""
+        assert not StreamConverter._deep_compare({"a": [1, 1, 2]}, {"a": [1, 2, 2]})
+        assert not StreamConverter._deep_compare({"a": 1}, {"a": 1.0})
+        assert not StreamConverter._deep_compare({"a": 1}, {"a": True})
+        assert not StreamConverter._deep_compare({"a": 1}, {"b": 1})
+
+    def test_numeric_lists_compare_as_multisets(self):
+        """Test the homogeneous numeric list path, including int/float mixes"""
+        assert StreamConverter._deep_compare({"ids": [3, 1, 2]}, {"ids": [1, 2, 3]})
+        assert StreamConverter._deep_compare(
+            {"lp": [-0.5, -1.25]}, {"lp": [-1.25, -0.5]}
+        )
+        assert not StreamConverter._deep_compare({"ids": [1, 2]}, {"ids": [1.0, 2]})
+        assert StreamConverter._deep_compare({"v": [1.0, 1]}, {"v": [1, 1.0]})
+        assert StreamConverter._deep_compare(
+            {"v": [0.0, -0.0, 1.5]}, {"v": [-0.0, 1.5, 0.0]}
+        )
+        assert not StreamConverter._deep_compare({"v": [0.0, 0.0]}, {"v": [0.0, -0.0]})
+
+    def test_non_finite_floats_and_key_types_are_distinct(self):
+        """Test that NaN/inf differ from null and int keys from str keys"""
+        nan, inf = float("nan"), float("inf")
+        assert not StreamConverter._deep_compare({"a": nan}, {"a": None})
+        assert not StreamConverter._deep_compare({"a": [inf]}, {"a": [None]})
+        assert not StreamConverter._deep_compare({"a": [inf]}, {"a": [-inf]})
+        assert not StreamConverter._deep_compare({1: "x"}, {"1": "x"})
+        assert StreamConverter._deep_compare({"a": [inf, 1.0]}, {"a": [1.0, inf]})
+
+    def test_enums_compare_by_value(self):
+        """Test that enum members equal their raw values"""
+        assert StreamConverter._deep_compare(
+            {"provider": Provider.openai}, {"provider": Provider.openai.value}
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
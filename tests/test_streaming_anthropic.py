@@ -4,8 +4,18 @@ Tests verify that streaming events are correctly converted between
 Anthropic SSE format and unified IR StreamEvent format.
 """
 
+import copy
+
 import pytest
 from src.transllm.adapters.anthropic import AnthropicAdapter
+from src.transllm.core.schema import StreamEvent, ToolCallDelta
+from src.transllm.core.stream_event import (
+    TAG_CONTENT_DELTA,
+    TAG_STREAM_END,
+    StreamEventBuffer,
+    StreamEventFast,
+    ToolCallDeltaDict,
+)
 from tests.fixtures.anthropic import (
     ANTHROPIC_STREAMING_EVENTS,
     ANTHROPIC_STREAMING_TOOL_EVENTS,
@@ -90,7 +100,7 @@ class TestAnthropicStreamingConversion:
         assert len(tool_deltas) == 2
 
         # Check that tool argument deltas are captured
-        # tool_call_delta is a Pydantic model, access as attribute
+        # tool_call_delta is a dict that also allows attribute access
         assert '{"location"' in tool_deltas[0].tool_call_delta.arguments_delta
         assert ': "Beijing"}' in tool_deltas[1].tool_call_delta.arguments_delta
 
@@ -161,6 +171,39 @@ class TestAnthropicStreamingConversion:
         assert unified2.timestamp >= unified1.timestamp
         assert unified3.timestamp >= unified2.timestamp
 
+    def test_batch_conversion_matches_per_event(self):
+        """Test that to_unified_stream_events() matches per-event conversion"""
+        self.adapter.reset_stream_state()
+        single = [
+            self.adapter.to_unified_stream_event(event)
+            for event in ANTHROPIC_STREAMING_EVENTS
+        ]
+
+        self.adapter.reset_stream_state()
+        batch = self.adapter.to_unified_stream_events(ANTHROPIC_STREAMING_EVENTS)
+
+        assert len(batch) == len(single)
+        for batched, expected in zip(batch, single):
+            assert batched.type == expected.type
+            assert batched.content_delta == expected.content_delta
+            assert batched.sequence_id == expected.sequence_id
+        timestamps = [e.timestamp for e in batch]
+        assert timestamps == sorted(set(timestamps))
+
+        # Sequence ids continue across batch and single-event calls
+        next_event = self.adapter.to_unified_stream_event(ANTHROPIC_STREAMING_EVENTS[2])
+        assert next_event.sequence_id == len(ANTHROPIC_STREAMING_EVENTS)
+        assert next_event.timestamp > timestamps[-1]
+
+    def test_stream_event_timestamps_strictly_increase(self):
+        """Test that rapid events never share a timestamp"""
+        self.adapter.reset_stream_state()
+        event = ANTHROPIC_STREAMING_EVENTS[2]
+        timestamps = [
+            self.adapter.to_unified_stream_event(event).timestamp for _ in range(200)
+        ]
+        assert all(a < b for a, b in zip(timestamps, timestamps[1:]))
+
     def test_stream_state_reset(self):
         """Test that reset_stream_state() resets sequence_id and timestamp"""
         self.adapter.reset_stream_state()
@@ -239,6 +282,59 @@ class TestAnthropicStreamingConversion:
         assert result["delta"]["type"] == "text_delta"
         assert result["delta"]["text"] == "Hello, world!"
 
+    def test_fast_events_convert_to_pydantic(self):
+        """Test that unvalidated events validate cleanly as StreamEvent"""
+        self.adapter.reset_stream_state()
+        for event in ANTHROPIC_STREAMING_EVENTS + ANTHROPIC_STREAMING_TOOL_EVENTS:
+            unified = self.adapter.to_unified_stream_event(event)
+            assert isinstance(unified, StreamEventFast)
+
+            validated = unified.to_pydantic()
+            assert isinstance(validated, StreamEvent)
+            assert validated.type is unified.type
+            assert self.adapter.from_unified_stream_event(
+                validated
+            ) == self.adapter.from_unified_stream_event(unified)
+
+    def test_tool_call_delta_dict_access(self):
+        """Test that tool call deltas read as both dict and ToolCallDelta"""
+        self.adapter.reset_stream_state()
+        unified = self.adapter.to_unified_stream_event(
+            ANTHROPIC_STREAMING_TOOL_EVENTS[2]
+        )
+        tc_delta = unified.tool_call_delta
+        assert isinstance(tc_delta, ToolCallDeltaDict)
+        assert tc_delta["arguments_delta"] == tc_delta.arguments_delta
+        assert tc_delta.identifier is None
+        assert not hasattr(tc_delta, "argumnts_delta")
+        assert not hasattr(tc_delta, "model_dump")
+        assert copy.deepcopy(tc_delta) == tc_delta
+
+        validated = unified.to_pydantic().tool_call_delta
+        assert isinstance(validated, ToolCallDelta)
+        assert validated.arguments_delta == tc_delta.arguments_delta
+
+    def test_fast_events_carry_type_tags(self):
+        """Test that type_tag matches the event type"""
+        self.adapter.reset_stream_state()
+        events = self.adapter.to_unified_stream_events(ANTHROPIC_STREAMING_EVENTS)
+
+        deltas = [e for e in events if e.type_tag == TAG_CONTENT_DELTA]
+        assert [e.content_delta for e in deltas] == ["Hello", " world"]
+        assert events[-1].type_tag == TAG_STREAM_END
+
+    def test_stream_event_buffer_columns(self):
+        """Test that StreamEventBuffer filters and rebuilds rows correctly"""
+        self.adapter.reset_stream_state()
+        events = self.adapter.to_unified_stream_events(ANTHROPIC_STREAMING_EVENTS)
+        buffer = StreamEventBuffer(events)
+
+        assert len(buffer) == len(events)
+        deltas = buffer.filter_type(TAG_CONTENT_DELTA)
+        assert [buffer.content_deltas[i] for i in deltas] == ["Hello", " world"]
+        assert list(buffer) == events
+        assert buffer[-1].type_tag == TAG_STREAM_END
+
 
 class TestAnthropicStreamingEdgeCases:
     """Test edge cases in streaming conversion"""
@@ -272,6 +368,22 @@ class TestAnthropicStreamingEdgeCases:
         # since delta is missing
         assert unified is not None
 
+    def test_null_nested_fields_fall_back(self):
+        """Test that null or non-dict nested payloads do not raise"""
+        self.adapter.reset_stream_state()
+        for event in (
+            {"type": "content_block_delta", "index": 0, "delta": None},
+            {"type": "content_block_delta", "index": 0, "delta": "text"},
+            {"type": "content_block_start", "index": 0, "content_block": None},
+            {"type": "message_start", "message": None},
+        ):
+            unified = self.adapter.to_unified_stream_event(event)
+            assert unified.type.value == "metadata_update"
+        batch = self.adapter.to_unified_stream_events(
+            [{"type": "content_block_delta", "delta": None}]
+        )
+        assert batch[0].metadata["event"] == "content_block_delta"
+
     def test_event_with_metadata_preservation(self):
         """Test that event metadata is preserved during conversion"""
         self.adapter.reset_stream_state()
@@ -0,0 +1,212 @@
+"""Tests for TOON encoding of tool results
+
+Tests verify that uniform tool results are re-encoded as TOON tables when
+requested, and that everything else is left as JSON.
+"""
+
+import json
+
+import pytest
+from src.transllm import Provider
+from src.transllm.converters.request_converter import RequestConverter
+from src.transllm.utils.toon import (
+    encode_table,
+    encode_tool_result,
+    encode_tool_results,
+    is_uniform_table,
+)
+
+ROWS = [
+    {"id": 1, "name": "Alice", "active": True},
+    {"id": 2, "name": "Bob", "active": False},
+]
+
+
+class TestToonTableEncoding:
+    """Test the TOON table encoder"""
+
+    def test_uniform_table_detection(self):
+        """Test that only flat, same-keyed rows count as uniform"""
+        assert is_uniform_table(ROWS)
+        assert not is_uniform_table([])
+        assert not is_uniform_table([{"id": 1}, {"id": 2, "name": "Bob"}])
+        assert not is_uniform_table([{"id": 1, "tags": ["a"]}])
+        assert not is_uniform_table([1, 2, 3])
+
+    def test_encode_table(self):
+        """Test the header and row layout"""
+        assert encode_table(ROWS) == (
+            "[2]{id,name,active}:\n  1,Alice,true\n  2,Bob,false"
+        )
+
+    def test_ambiguous_strings_are_quoted(self):
+        """Test that strings that could be misread are quoted"""
+        rows = [
+            {"v": "a,b"},
+            {"v": "42"},
+            {"v": "true"},
+            {"v": ""},
+            {"v": " padded"},
+            {"v": None},
+        ]
+        assert encode_table(rows).splitlines()[1:] == [
+            '  "a,b"',
+            '  "42"',
+            '  "true"',
+            '  ""',
+            '  " padded"',
+            "  null",
+        ]
+
+    def test_encode_tool_result_shapes(self):
+        """Test list, JSON string and dict tool result payloads"""
+        table = encode_table(ROWS)
+        assert encode_tool_result(ROWS) == table
+        assert encode_tool_result(json.dumps(ROWS)) == table
+        assert encode_tool_result({"rows": ROWS, "total": 2}) == {
+            "rows": table,
+            "total": 2,
+        }
+
+    def test_non_uniform_results_are_unchanged(self):
+        """Test that nested or plain results keep their JSON form"""
+        nested = [{"id": 1, "meta": {"a": 1}}]
+        assert encode_tool_result(nested) is nested
+        assert encode_tool_result("plain text") == "plain text"
+        assert encode_tool_result("[not json") == "[not json"
+
+        result = {"content": "done"}
+        assert encode_tool_result(result) is result
+
+    def test_content_blocks_are_not_tables(self):
+        """Test that lists of typed content blocks are never encoded"""
+        parts = [
+            {"type": "text", "text": "sunny"},
+            {"type": "text", "text": "and warm"},
+        ]
+        assert encode_tool_result(parts) is parts
+        assert encode_tool_result(json.dumps(parts)) == json.dumps(parts)
+
+        payload = {"messages": [{"role": "tool", "content": parts}]}
+        assert encode_tool_results(payload)["messages"][0]["content"] is parts
+
+    def test_input_is_not_mutated(self):
+        """Test that dict payloads are copied rather than modified"""
+        result = {"rows": list(ROWS)}
+        encode_tool_result(result)
+        assert result == {"rows": ROWS}
+
+
+class TestRequestConverterToonOption:
+    """Test the tool_result_encoding option of RequestConverter"""
+
+    def setup_method(self):
+        self.request = {
+            "model": "claude-3-5-sonnet-20241022",
+            "max_tokens": 1024,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "tool_result",
+                            "tool_use_id": "toolu_01",
+                            "content": {"rows": ROWS},
+                        }
+                    ],
+                }
+            ],
+        }
+
+    def test_default_keeps_json(self):
+        """Test that tool results are untouched by default"""
+        result = RequestConverter.convert(
+            self.request, Provider.anthropic, Provider.anthropic
+        )
+        block = result["messages"][0]["content"][0]
+        assert block["content"] == {"rows": ROWS}
+
+    def test_toon_encoding_for_anthropic(self):
+        """Test that uniform Anthropic tool results are TOON encoded"""
+        result = RequestConverter.convert(
+            self.request,
+            Provider.anthropic,
+            Provider.anthropic,
+            tool_result_encoding="toon",
+        )
+        block = result["messages"][0]["content"][0]
+        assert block["content"] == {"rows": encode_table(ROWS)}
+
+    def test_toon_encoding_for_openai_tool_message(self):
+        """Test that JSON string content of OpenAI tool messages is encoded"""
+        request = {
+            "model": "gpt-4",
+            "messages": [
+                {"role": "user", "content": "List the users"},
+                {"role": "tool", "content": json.dumps(ROWS)},
+            ],
+        }
+        result = RequestConverter.convert(
+            request, Provider.openai, Provider.openai, tool_result_encoding="toon"
+        )
+        assert result["messages"][1]["content"] == encode_table(ROWS)
+        assert result["messages"][0]["content"] == "List the users"
+
+    def test_openai_tool_message_content_parts_are_kept(self):
+        """Test that OpenAI tool messages with content parts are untouched"""
+        parts = [
+            {"type": "text", "text": "sunny"},
+            {"type": "text", "text": "and warm"},
+        ]
+        request = {
+            "model": "gpt-4",
+            "messages": [
+                {"role": "user", "content": "Weather?"},
+                {"role": "tool", "tool_call_id": "call_1", "content": parts},
+            ],
+        }
+        result = RequestConverter.convert(
+            request, Provider.openai, Provider.openai, tool_result_encoding="toon"
+        )
+        assert not isinstance(result["messages"][1]["content"], str)
+
+    def test_openai_tool_message_converted_to_anthropic(self):
+        """Test that tool text blocks are encoded after cross-provider conversion"""
+        request = {
+            "model": "gpt-4",
+            "messages": [
+                {"role": "user", "content": "List the users"},
+                {"role": "tool", "tool_call_id": "call_1", "content": json.dumps(ROWS)},
+            ],
+        }
+        result = RequestConverter.convert(
+            request, Provider.openai, Provider.anthropic, tool_result_encoding="toon"
+        )
+        assert result["messages"][1]["content"] == [
+            {"type": "text", "text": encode_table(ROWS)}
+        ]
+        assert result["messages"][0]["content"] == [
+            {"type": "text", "text": "List the users"}
+        ]
+
+    def test_tool_message_text_parts_are_encoded_in_place(self):
+        """Test that text parts keep their list and non-table text is kept"""
+        parts = [{"text": json.dumps(ROWS)}, {"text": "done"}]
+        payload = {"contents": [{"role": "tool", "parts": parts}]}
+        encode_tool_results(payload)
+        assert payload["contents"][0]["parts"] is parts
+        assert parts == [{"text": encode_table(ROWS)}, {"text": "done"}]
+
+    def test_invalid_encoding_raises(self):
+        """Test that an unknown encoding is rejected"""
+        with pytest.raises(ValueError):
+            RequestConverter.convert(
+                self.request,
+                Provider.anthropic,
+                Provider.anthropic,
+                tool_result_encoding="yaml",
+            )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])